@@ -6,17 +6,46 @@
 """
 import sys
 import os
+import atexit
 import json
 import time
 import asyncio
 import requests
 import io
 import re
-import js2py
+import queue
+import logging
+import logging.handlers
+import pathlib
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Tuple, Optional, Any
+from typing import Dict, Iterable, List, Set, Tuple, Optional, Any
 from datetime import datetime
+from operator import itemgetter
+
+# JSON库：优先使用orjson（更快，直接处理bytes），未安装时回退到标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# HTML解析器：优先使用C实现的lxml，未安装时回退到内置html.parser
+try:
+    import lxml.html as lxml_html
+    from lxml.etree import ParserError as LxmlParserError
+    HTML_PARSER = "lxml"
+except ImportError:
+    lxml_html = None
+    LxmlParserError = None
+    HTML_PARSER = "html.parser"
+
+# 事件循环：优先使用libuv实现的uvloop（不支持Windows），未安装时使用asyncio默认循环
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # 设置标准输出编码为UTF-8
 if sys.stdout.encoding is None or sys.stdout.encoding.upper() != 'UTF-8':
@@ -24,408 +53,689 @@ if sys.stdout.encoding is None or sys.stdout.encoding.upper() != 'UTF-8':
 if sys.stderr.encoding is None or sys.stderr.encoding.upper() != 'UTF-8':
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# 日志：各爬虫线程只负责入队，格式化与输出在监听线程中完成（见 setup_logging）
+logger = logging.getLogger("proxy_collector")
+
 # 简单配置
 CONFIG = {
     "crawler_workers": 20,  # 增加爬虫工作者数量以支持更多源（现有20个源）
+    "crawler_mode": "async",  # 爬取方式：async（aiohttp单线程并发）或sync（线程池）
+    "async_crawler_concurrency": 50,  # 异步爬取的总连接数上限
+    "async_crawler_per_host": 4,  # 异步爬取时单个主机的连接数上限
     "validator_workers": 10,
-    "async_validator_concurrency": 50,  # 异步验证并发数（根据网络情况调整）
+    "page_workers": 8,  # 单个源内分页并发抓取的线程数（需不大于连接池大小）
+    "async_validator_concurrency": 50,  # 异步验证初始并发数（根据网络情况调整），也是自适应调整的下限
+    "async_validator_max_concurrency": 500,  # 异步验证自适应调整的并发上限
     "validation_method": "async",  # 验证方法：async（异步）或sync（同步，线程池）
     "timeout": 5,  # 单个代理测试超时时间（秒）
+    "connect_timeout": 2,  # 验证时连接代理的超时时间（秒），无法连接的代理在此时间内即被淘汰
     "test_url": "https://httpbin.org/ip",
     "max_response_time": 5.0,
     "data_dir": "./data",
-    "data_file": "proxies.json"
+    "data_file": "proxies.json",
+    "revalidate_after": 3600,  # 已有代理在此时间（秒）内验证通过过则不再重复测试，设为0则每次全部重新验证
+    "checkpoint_file": "proxies.ndjson"  # 验证过程中的增量检查点（NDJSON，每行一个代理）
+}
+
+# 数据文件路径（只计算一次）
+DATA_PATH = pathlib.Path(CONFIG["data_dir"]) / CONFIG["data_file"]
+CHECKPOINT_PATH = DATA_PATH.parent / CONFIG["checkpoint_file"]
+
+# 预编译正则（避免在解析热路径中重复查找re缓存）
+IP3366_ROW_RE = re.compile(r'<tr>\s*<td>([^<]+)</td>\s*<td>([^<]+)</td>\s*<td>[^<]+</td>\s*<td>([^<]+)</td>', re.IGNORECASE)
+# 规整表格行：<tr><td>IP</td><td>端口</td>[<td>第三列</td>]...
+TABLE_ROW_RE = re.compile(
+    r'<tr[^>]*>\s*<td[^>]*>\s*(\d{1,3}(?:\.\d{1,3}){3})\s*</td>\s*<td[^>]*>\s*(\d{1,5})\s*</td>'
+    r'(?:\s*<td[^>]*>\s*([^<]*?)\s*</td>)?',
+    re.IGNORECASE,
+)
+# kuaidaili表格行：IP、端口、匿名度、类型
+KUAIDAILI_ROW_RE = re.compile(
+    r'<tr[^>]*>\s*<td[^>]*>\s*(\d{1,3}(?:\.\d{1,3}){3})\s*</td>\s*<td[^>]*>\s*(\d{1,5})\s*</td>'
+    r'\s*<td[^>]*>[^<]*</td>\s*<td[^>]*>\s*([^<]*?)\s*</td>',
+    re.IGNORECASE,
+)
+EVAL_RE = re.compile(r'eval\(function\(p,r,o,x,y,s\)\{.*?\}\(.*?\)\)', re.DOTALL)
+EVAL_PARSE_RE = re.compile(r"eval\(function\(.*?\)\{.*?\}\((.*?)\)\)", re.DOTALL)
+PORT_EXPR_RE = re.compile(r'\(([^)]+)\)')
+PORT_SCRIPT_RE = re.compile(r'document\.write\(":"\s*\+\s*(.*)\)')
+
+# spys.one 端口混淆脚本（p.a.c.k.e.r）解包用正则
+PACKER_ARGS_RE = re.compile(
+    r"'((?:[^'\\]|\\.)*)',\s*(\d+),\s*(\d+),\s*'((?:[^'\\]|\\.)*)'\.split\('((?:[^'\\]|\\.)*)'\)",
+    re.DOTALL,
+)
+JS_ESCAPE_RE = re.compile(r"\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)", re.DOTALL)
+JS_WORD_RE = re.compile(r"\b\w+\b")
+# 单元格/行级IP、端口匹配
+LOOSE_IP_PORT_RE = re.compile(r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s*[:：]\s*(\d{2,5})')
+LINE_IP_PORT_RE = re.compile(r'^(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}):(\d+)$')
+# 直接在整个响应体（bytes）上匹配 ip:port，不先解码、不逐行拆分字符串
+IP_PORT_BYTES_RE = re.compile(rb'(?<![\d.])(\d{1,3}(?:\.\d{1,3}){3}):(\d{1,5})(?!\d)')
+# 不构建DOM时按原始HTML切分表格行与单元格
+HTML_ROW_RE = re.compile(r'<tr\b[^>]*>(.*?)</tr>', re.IGNORECASE | re.DOTALL)
+HTML_CELL_RE = re.compile(r'<td\b[^>]*>(.*?)</td>', re.IGNORECASE | re.DOTALL)
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+# 按字符窗口截取HTML时首尾可能残留半个标签（如 ef="https://...">），剥离标签后再去掉这些残片
+PARTIAL_TAG_RE = re.compile(r'^[^<]*>|<[^>]*$')
+LINE_PROXY_URL_RE = re.compile(r'^(socks[45]|http|https)://\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d+$')
+
+# 协议前缀（拼接代理字符串时直接取用，避免每行重复格式化）
+PROTOCOL_PREFIX = {
+    "http": "http://",
+    "https": "https://",
+    "socks": "socks://",
+    "socks4": "socks4://",
+    "socks5": "socks5://",
+    "socks5h": "socks5h://",
 }
 
+# 协议关键字按优先级排列：socks5/socks4须先于socks，https须先于http
+PROTOCOL_PRIORITY = ('socks5', 'socks4', 'https', 'socks', 'http')
+
+# 共享HTTP会话：复用TCP/TLS连接（keep-alive + 连接池），避免每次请求重新握手
+# 连接池大小不小于爬虫线程数，保证所有源并发时都能复用连接
+# 连接错误及429/5xx自动指数退避重试；重试耗尽后返回最后的响应，由各源按状态码处理
+SESSION = requests.Session()
+_pool_size = max(32, CONFIG["crawler_workers"])
+_retry = Retry(
+    total=2,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),
+    raise_on_status=False,
+)
+_adapter = HTTPAdapter(pool_connections=_pool_size, pool_maxsize=_pool_size, max_retries=_retry)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# 日志监听线程：整个进程只启动一次
+LOG_LISTENER = None
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """配置队列日志：记录经队列交给监听线程统一输出到标准输出
+
+    main()会自动调用；重复调用时直接返回已启动的监听器，进程退出时停止监听并输出剩余记录。
+    """
+    global LOG_LISTENER
+    if LOG_LISTENER is not None:
+        return LOG_LISTENER
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    LOG_LISTENER = logging.handlers.QueueListener(log_queue, stream_handler)
+    LOG_LISTENER.start()
+    atexit.register(LOG_LISTENER.stop)
+    return LOG_LISTENER
+
+def json_loads(data):
+    """解析JSON（接受str或bytes）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj) -> bytes:
+    """序列化为带2空格缩进的UTF-8 JSON字节串"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def json_dumps_line(obj) -> bytes:
+    """序列化为单行紧凑JSON字节串（用于NDJSON）"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def run_async(coro):
+    """在新的事件循环中运行协程直到完成（有uvloop时使用uvloop）"""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
 def setup_data_dir():
     """设置数据目录"""
-    os.makedirs(CONFIG["data_dir"], exist_ok=True)
+    DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-def load_existing_proxies() -> List[str]:
-    """加载已有的代理"""
-    data_file = os.path.join(CONFIG["data_dir"], CONFIG["data_file"])
-    if os.path.exists(data_file):
+def load_existing_proxies() -> Dict[str, int]:
+    """加载已有的代理及其最近一次验证通过的时间戳，包括上次运行中断时检查点里尚未汇总的代理"""
+    proxies: Dict[str, int] = {}
+    if DATA_PATH.exists():
         try:
-            with open(data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get("proxies", [])
-        except:
+            data = json_loads(DATA_PATH.read_bytes())
+            last_checked = data.get("last_checked", {})
+            # 旧格式的数据文件没有验证时间，记为0（需要重新验证）
+            proxies.update((proxy, last_checked.get(proxy, 0)) for proxy in data.get("proxies", []))
+        except (OSError, ValueError, AttributeError, TypeError):
+            # 文件损坏或格式不符时忽略，按没有已有代理处理
             pass
-    return []
+    # 检查点里的记录比数据文件新
+    proxies.update(load_checkpoint_proxies())
+    return proxies
+
+def load_checkpoint_proxies() -> Dict[str, int]:
+    """读取NDJSON检查点中的代理及其验证时间戳"""
+    proxies: Dict[str, int] = {}
+    if not CHECKPOINT_PATH.exists():
+        return proxies
+    for line in CHECKPOINT_PATH.read_bytes().splitlines():
+        if not line:
+            continue
+        try:
+            record = json_loads(line)
+            proxies[record["p"]] = record.get("t", 0)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            # 写入中途崩溃可能留下不完整的最后一行
+            continue
+    return proxies
 
-def save_proxies(proxies: List[str]):
-    """保存代理列表"""
-    data_file = os.path.join(CONFIG["data_dir"], CONFIG["data_file"])
+def append_proxies(proxies: Iterable[str]):
+    """将新验证通过的代理追加到NDJSON检查点，写入量只与新增数量有关"""
+    timestamp = int(time.time())
+    lines = [json_dumps_line({"p": proxy, "t": timestamp}) for proxy in proxies]
+    if not lines:
+        return
+    with open(CHECKPOINT_PATH, 'ab') as f:
+        f.write(b'\n'.join(lines) + b'\n')
+
+def save_proxies(proxies: List[str], last_checked: Optional[Dict[str, int]] = None):
+    """保存代理列表（去重并排序），同时记录每个代理最近一次验证通过的时间戳"""
+    proxies = sorted(set(proxies))
+    last_checked = last_checked or {}
+    now = int(time.time())
     data = {
         "version": "1.0",
         "last_updated": datetime.utcnow().isoformat() + "Z",
         "total_proxies": len(proxies),
-        "proxies": proxies
+        "proxies": proxies,
+        "last_checked": {proxy: last_checked.get(proxy, now) for proxy in proxies}
     }
 
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # 先写临时文件并落盘，再原子替换，避免中途崩溃或断电留下损坏的文件
+    tmp_path = DATA_PATH.with_suffix('.json.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(json_dumps(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, DATA_PATH)
+
+    # 检查点内容已汇总进数据文件，清空以便下次运行重新累积
+    CHECKPOINT_PATH.unlink(missing_ok=True)
 
     return True
 
+def iter_clean_lines(lines, skip: int = 0):
+    """逐行迭代文本，跳过前skip行，返回去除空白后的非空行"""
+    for index, raw in enumerate(lines):
+        if index < skip:
+            continue
+        line = raw.strip()
+        if line:
+            yield line
+
+def iter_response_lines(response, skip: int = 0):
+    """流式逐行读取文本响应，跳过前skip行，返回去除空白后的非空行"""
+    if response.encoding is None:
+        response.encoding = 'utf-8'
+    return iter_clean_lines(response.iter_lines(decode_unicode=True), skip)
+
+# 爬虫线程池：整个进程只创建一次，定时或在长驻服务中反复爬取时不再反复创建/销毁线程
+CRAWL_POOL = None
+
+def get_crawl_pool() -> ThreadPoolExecutor:
+    """返回共享的爬虫线程池，首次调用时创建，进程退出时关闭"""
+    global CRAWL_POOL
+    if CRAWL_POOL is None:
+        CRAWL_POOL = ThreadPoolExecutor(max_workers=CONFIG["crawler_workers"], thread_name_prefix="crawl")
+        atexit.register(CRAWL_POOL.shutdown, wait=False)
+    return CRAWL_POOL
+
+def fetch_pages_concurrently(fetch_page, pages, max_workers: Optional[int] = None) -> List[str]:
+    """并发抓取同一源的多个分页，合并并去重结果"""
+    pages = list(pages)
+    if not pages:
+        return []
+    workers = min(len(pages), max_workers or CONFIG["page_workers"])
+    proxies: Set[str] = set()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for page_proxies in executor.map(fetch_page, pages):
+            proxies.update(page_proxies)
+    return list(proxies)
+
+def iter_table_rows(html: str):
+    """逐个返回HTML中每个<tr>的<td>单元格文本列表（空白已规整）
+
+    只需要表格单元格文本的源使用此函数：有lxml时直接遍历lxml树，
+    不为每个节点构造BeautifulSoup对象；否则回退到BeautifulSoup。
+    lxml无法解析的输入（带encoding声明的str、只有注释的页面等）同样回退到BeautifulSoup。
+    """
+    if not html or not html.strip():
+        return
+    if lxml_html is not None:
+        try:
+            root = lxml_html.fromstring(html)
+        except (ValueError, LxmlParserError):
+            root = None
+        if root is not None:
+            for row in root.iter('tr'):
+                yield [' '.join(td.text_content().split()) for td in row.findall('td')]
+            return
+    for row in BeautifulSoup(html, HTML_PARSER).find_all('tr'):
+        yield [td.get_text(' ', strip=True) for td in row.find_all('td')]
+
+GEONODE_URL = "https://proxylist.geonode.com/api/proxy-list?limit=500&page={page}&sort_by=lastChecked&sort_type=desc"
+GEONODE_MAX_PAGES = 3  # 限制页数以避免请求过多
+
+# 一次取出Geonode条目所需的字段
+GEONODE_ITEM_FIELDS = itemgetter("ip", "port", "protocols")
+
+def _extract_geonode_proxies(data) -> List[str]:
+    """从Geonode API返回的JSON中提取代理"""
+    proxies = []
+    for item in data.get("data", []):
+        try:
+            ip, port, protocols = GEONODE_ITEM_FIELDS(item)
+        except KeyError:
+            # 缺少必需字段的条目直接跳过
+            continue
+
+        if ip and port and protocols:
+            proxies.append(f"{protocols[0]}://{ip}:{port}")
+    return proxies
+
 def fetch_geonode_proxies() -> List[str]:
     """从Geonode获取代理（多页）"""
-    proxies = []
-    max_pages = 3  # 限制页数以避免请求过多
-    max_retries = 2
 
-    for page in range(1, max_pages + 1):
-        url = f"https://proxylist.geonode.com/api/proxy-list?limit=500&page={page}&sort_by=lastChecked&sort_type=desc"
+    def _fetch_page(page: int) -> List[str]:
+        page_proxies = []
 
-        for attempt in range(max_retries):
-            try:
-                timeout = CONFIG["timeout"] * (attempt + 1)
-                response = requests.get(url, timeout=timeout)
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get("data", [])
-                    if not items:
-                        break  # 没有数据则停止翻页
-
-                    for item in items:
-                        ip = item.get("ip")
-                        port = item.get("port")
-                        protocols = item.get("protocols", [])
-
-                        if ip and port and protocols:
-                            protocol = protocols[0] if protocols else "http"
-                            proxy = f"{protocol}://{ip}:{port}"
-                            proxies.append(proxy)
-                    print(f"Geonode 第 {page} 页: 获取 {len(items)} 个代理")
-                    break  # 成功则退出重试循环
-                else:
-                    print(f"Geonode 第 {page} 页请求失败 (HTTP {response.status_code})，重试 {attempt+1}/{max_retries}")
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    print(f"Geonode 第 {page} 页爬取失败: {e}")
-                else:
-                    print(f"Geonode 第 {page} 页爬取失败，重试 {attempt+1}/{max_retries}: {e}")
-                    time.sleep(2)
+        # 失败重试与退避由SESSION上挂载的Retry处理
+        try:
+            response = SESSION.get(GEONODE_URL.format(page=page), timeout=CONFIG["timeout"])
+            if response.status_code == 200:
+                page_proxies = _extract_geonode_proxies(json_loads(response.content))
+                logger.info("Geonode 第 %s 页: 获取 %s 个代理", page, len(page_proxies))
+            else:
+                logger.warning("Geonode 第 %s 页请求失败 (HTTP %s)", page, response.status_code)
+        except Exception as e:
+            logger.warning("Geonode 第 %s 页爬取失败: %s", page, e)
 
-    return proxies
+        return page_proxies
+
+    # 第1页没有数据（或请求失败）时不再翻页；否则并发抓取其余分页
+    first_page = _fetch_page(1)
+    if not first_page:
+        return []
+    proxies: Set[str] = set(first_page)
+    proxies.update(fetch_pages_concurrently(_fetch_page, range(2, GEONODE_MAX_PAGES + 1)))
+    return list(proxies)
+
+FREE_PROXY_LIST_URL = "https://free-proxy-list.net/"
+
+def _extract_free_proxy_list_proxies(data: bytes) -> List[str]:
+    """简单解析表格，查找IP:Port格式（直接匹配原始响应体，无需先解码）"""
+    return [(b"http://" + ip + b":" + port).decode('ascii') for ip, port in IP_PORT_BYTES_RE.findall(data)]
 
 def fetch_free_proxy_list() -> List[str]:
     """从free-proxy-list.net获取代理"""
-    proxies = []
-    url = "https://free-proxy-list.net/"
+    proxies: Set[str] = set()
 
     try:
-        response = requests.get(url, timeout=CONFIG["timeout"])
+        response = SESSION.get(FREE_PROXY_LIST_URL, timeout=CONFIG["timeout"])
         if response.status_code == 200:
-            # 简单解析表格
-            import re
-            # 查找IP:Port格式
-            pattern = r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}):(\d{2,5})'
-            matches = re.findall(pattern, response.text)
-            for ip, port in matches:
-                proxy = f"http://{ip}:{port}"
-                proxies.append(proxy)
+            proxies.update(_extract_free_proxy_list_proxies(response.content))
     except Exception as e:
-        print(f"Free Proxy List爬取失败: {e}")
+        logger.warning("Free Proxy List爬取失败: %s", e)
 
-    return proxies
+    return list(proxies)
+
+PROXYSCRAPE_URL = "https://api.proxyscrape.com/v2/?request=displayproxies&protocol={protocol}&timeout=10000&country=all&ssl=all&anonymity=all"
+PROXYSCRAPE_PROTOCOLS = ["http", "socks4", "socks5"]
+
+def _extract_proxyscrape_proxies(lines, protocol: str) -> List[str]:
+    """ProxyScrape每行一个ip:port"""
+    # 调整socks5协议
+    prefix = PROTOCOL_PREFIX["socks5h" if protocol == "socks5" else protocol]
+    return [prefix + proxy for proxy in lines]
 
 def fetch_proxyscrape_proxies() -> List[str]:
     """从ProxyScrape获取代理"""
-    proxies = []
-    protocols = ["http", "socks4", "socks5"]
+    proxies: Set[str] = set()
 
-    for protocol in protocols:
+    for protocol in PROXYSCRAPE_PROTOCOLS:
         try:
             # 直接请求原始URL
-            url = f"https://api.proxyscrape.com/v2/?request=displayproxies&protocol={protocol}&timeout=10000&country=all&ssl=all&anonymity=all"
-            response = requests.get(url, timeout=CONFIG["timeout"])
-            if response.status_code == 200:
-                proxy_list = response.text.strip().split("\r\n")
-                for proxy in proxy_list:
-                    if proxy.strip():
-                        # 调整socks5协议
-                        proxy_protocol = protocol
-                        if protocol == "socks5":
-                            proxy_protocol = "socks5h"
-                        proxies.append(f"{proxy_protocol}://{proxy}")
-                print(f"ProxyScrape {protocol}: 获取 {len(proxy_list)} 个代理")
+            url = PROXYSCRAPE_URL.format(protocol=protocol)
+            with SESSION.get(url, timeout=CONFIG["timeout"], stream=True) as response:
+                if response.status_code == 200:
+                    found = _extract_proxyscrape_proxies(iter_response_lines(response), protocol)
+                    proxies.update(found)
+                    logger.info("ProxyScrape %s: 获取 %s 个代理", protocol, len(found))
         except Exception as e:
-            print(f"ProxyScrape {protocol} 爬取失败: {e}")
+            logger.warning("ProxyScrape %s 爬取失败: %s", protocol, e)
 
-    return proxies
+    return list(proxies)
 
 
+ROOSTERKID_SOURCES = [
+    ("https://raw.githubusercontent.com/roosterkid/openproxylist/main/SOCKS4.txt", "socks4"),
+    ("https://raw.githubusercontent.com/roosterkid/openproxylist/main/SOCKS5.txt", "socks5h"),
+    ("https://raw.githubusercontent.com/roosterkid/openproxylist/main/HTTPS.txt", "https"),
+]
+ROOSTERKID_HEADER_LINES = 12  # 文件开头的标题行数
+
+def _extract_roosterkid_proxies(lines, protocol: str) -> List[str]:
+    """RoosterKid每行第二个字段为ip:port，#开头为注释"""
+    prefix = PROTOCOL_PREFIX[protocol]
+    # 只需前两个字段，split最多切分两次，不拆分行尾的国家/延迟等信息
+    rows = (line.split(None, 2) for line in lines if not line.startswith("#"))
+    return [prefix + parts[1] for parts in rows if len(parts) >= 2]
+
 def fetch_roosterkid_proxies() -> List[str]:
     """从RoosterKid的GitHub仓库获取代理"""
-    proxies = []
-    sources = [
-        ("https://raw.githubusercontent.com/roosterkid/openproxylist/main/SOCKS4.txt", "socks4"),
-        ("https://raw.githubusercontent.com/roosterkid/openproxylist/main/SOCKS5.txt", "socks5h"),
-        ("https://raw.githubusercontent.com/roosterkid/openproxylist/main/HTTPS.txt", "https"),
-    ]
+    proxies: Set[str] = set()
 
-    for url, protocol in sources:
+    for url, protocol in ROOSTERKID_SOURCES:
         try:
-            response = requests.get(url, timeout=CONFIG["timeout"])
-            if response.status_code == 200:
-                lines = response.text.strip().split("\n")
-                # 跳过标题行（前12行）
-                data_lines = lines[12:] if len(lines) > 12 else lines
-                count = 0
-                for line in data_lines:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            proxy = f"{protocol}://{parts[1]}"
-                            proxies.append(proxy)
-                            count += 1
-                print(f"RoosterKid {protocol}: 获取 {count} 个代理")
+            with SESSION.get(url, timeout=CONFIG["timeout"], stream=True) as response:
+                if response.status_code == 200:
+                    # 跳过标题行
+                    lines = iter_response_lines(response, skip=ROOSTERKID_HEADER_LINES)
+                    found = _extract_roosterkid_proxies(lines, protocol)
+                    proxies.update(found)
+                    logger.info("RoosterKid %s: 获取 %s 个代理", protocol, len(found))
         except Exception as e:
-            print(f"RoosterKid {protocol} 爬取失败: {e}")
+            logger.warning("RoosterKid %s 爬取失败: %s", protocol, e)
 
-    return proxies
+    return list(proxies)
+
+
+PROXIFLY_URL = "https://cdn.jsdelivr.net/gh/proxifly/free-proxy-list@main/proxies/all/data.txt"
 
+def _extract_proxifly_proxies(lines) -> List[str]:
+    """原格式已经是完整代理，如 http://ip:port"""
+    # 将socks5替换为socks5h，socks4保持原样
+    return [line.replace("socks5://", "socks5h://", 1) for line in lines]
 
 def fetch_proxifly_proxies() -> List[str]:
     """从proxifly/free-proxy-list获取代理"""
-    proxies = []
-    url = "https://cdn.jsdelivr.net/gh/proxifly/free-proxy-list@main/proxies/all/data.txt"
+    proxies: Set[str] = set()
 
     try:
-        response = requests.get(url, timeout=CONFIG["timeout"])
-        if response.status_code == 200:
-            lines = response.text.strip().split("\n")
-            count = 0
-            for line in lines:
-                line = line.strip()
-                if line:
-                    # 原格式已经是完整代理，如 http://ip:port
-                    # 将socks5替换为socks5h，socks4替换为socks4h
-                    proxy = line
-                    if "socks5://" in proxy:
-                        proxy = proxy.replace("socks5://", "socks5h://")
-                    elif "socks4://" in proxy:
-                        # socks4保持原样，不需要socks4h
-                        pass
-                    proxies.append(proxy)
-                    count += 1
-            print(f"Proxifly Free Proxy List: 获取 {count} 个代理")
+        with SESSION.get(PROXIFLY_URL, timeout=CONFIG["timeout"], stream=True) as response:
+            if response.status_code == 200:
+                found = _extract_proxifly_proxies(iter_response_lines(response))
+                proxies.update(found)
+                logger.info("Proxifly Free Proxy List: 获取 %s 个代理", len(found))
     except Exception as e:
-        print(f"Proxifly Free Proxy List爬取失败: {e}")
+        logger.warning("Proxifly Free Proxy List爬取失败: %s", e)
 
-    return proxies
+    return list(proxies)
 
 
+SOCKSLIST_US_URL = "https://sockslist.us/Raw"
+
+def _extract_sockslist_us_proxies(lines) -> List[str]:
+    """sockslist.us每行一个ip:port，同时生成socks5与socks5h两种协议"""
+    entries = [line for line in lines if ":" in line]
+    return ["socks5://" + entry for entry in entries] + ["socks5h://" + entry for entry in entries]
+
 def fetch_sockslist_us_proxies() -> List[str]:
     """从sockslist.us获取代理"""
-    proxies = []
-    url = "https://sockslist.us/Raw"
+    proxies: Set[str] = set()
 
     try:
-        response = requests.get(url, timeout=CONFIG["timeout"])
-        if response.status_code == 200:
-            lines = response.text.strip().split("\n")
-            count = 0
-            for line in lines:
-                line = line.strip()
-                if line and ":" in line:
-                    # 添加两种协议
-                    proxies.append(f"socks5://{line}")
-                    proxies.append(f"socks5h://{line}")
-                    count += 2
-            print(f"SocksList US: 获取 {count} 个代理")
+        with SESSION.get(SOCKSLIST_US_URL, timeout=CONFIG["timeout"], stream=True) as response:
+            if response.status_code == 200:
+                found = _extract_sockslist_us_proxies(iter_response_lines(response))
+                proxies.update(found)
+                logger.info("SocksList US: 获取 %s 个代理", len(found))
     except Exception as e:
-        print(f"SocksList US爬取失败: {e}")
+        logger.warning("SocksList US爬取失败: %s", e)
+
+    return list(proxies)
+
+
+# 各站点请求头/cookies在导入时构建一次，按请求复用
+ZDAYE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.3",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Referer": "https://www.zdaye.com/",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "same-origin",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0"
+}
 
-    return proxies
 
+ZDAYE_URL = "https://www.zdaye.com/free/{page}/"
+ZDAYE_MAX_PAGES = 5  # 爬取最多5页
 
 
+def _extract_zdaye_proxies(html: str) -> Optional[List[str]]:
+    """从zdaye页面提取代理，未找到表格时返回None"""
+    table_start = html.find("abox ov")
+    if table_start == -1:
+        return None
+
+    # 表格结构规整，直接用正则扫描表格块之后的原始HTML
+    # 原爬虫使用 socks5 协议
+    return ["socks5://" + match.group(1) + ":" + match.group(2)
+            for match in TABLE_ROW_RE.finditer(html, table_start)]
+
 
 def fetch_zdaye_proxies() -> List[str]:
     """从zdaye.com获取代理"""
-    proxies = []
-    max_pages = 5  # 爬取最多5页
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.3",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Referer": "https://www.zdaye.com/",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "same-origin",
-        "Sec-Fetch-User": "?1",
-        "Cache-Control": "max-age=0"
-    }
 
-    for page in range(1, max_pages + 1):
+    def _fetch_page(page: int) -> List[str]:
+        page_proxies = []
         try:
-            url = f"https://www.zdaye.com/free/{page}/"
-            response = requests.get(url, headers=headers, timeout=CONFIG["timeout"])
+            response = SESSION.get(ZDAYE_URL.format(page=page), headers=ZDAYE_HEADERS, timeout=CONFIG["timeout"])
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
-                table_block_div = soup.find("div", class_="abox ov")
-                if not table_block_div:
-                    print(f"Zdaye 第 {page} 页: 未找到表格")
-                    continue
-
-                page_proxies = []
-                for table in table_block_div.find_all("table"):
-                    for tbody in table.find_all("tbody"):
-                        for tr in tbody.find_all("tr"):
-                            row_data = [td.get_text(strip=True) for td in tr.find_all("td")]
-                            if len(row_data) >= 2:
-                                ip = row_data[0]
-                                port = row_data[1]
-                                # 原爬虫使用 socks5 协议
-                                proxy = f"socks5://{ip}:{port}"
-                                page_proxies.append(proxy)
-                print(f"Zdaye 第 {page} 页: 获取 {len(page_proxies)} 个代理")
-                proxies.extend(page_proxies)
+                found = _extract_zdaye_proxies(response.content.decode('utf-8', errors='replace'))
+                if found is None:
+                    logger.warning("Zdaye 第 %s 页: 未找到表格", page)
+                    return page_proxies
+                page_proxies = found
+                logger.info("Zdaye 第 %s 页: 获取 %s 个代理", page, len(page_proxies))
             else:
-                print(f"Zdaye 第 {page} 页请求失败 (HTTP {response.status_code})")
+                logger.warning("Zdaye 第 %s 页请求失败 (HTTP %s)", page, response.status_code)
         except Exception as e:
-            print(f"Zdaye 第 {page} 页爬取失败: {e}")
+            logger.warning("Zdaye 第 %s 页爬取失败: %s", page, e)
+        return page_proxies
+
+    return fetch_pages_concurrently(_fetch_page, range(1, ZDAYE_MAX_PAGES + 1))
+
+
+def _is_ipv4(text: str) -> bool:
+    """检查是否为可用作代理的IPv4地址（排除0.x.x.x与广播地址）"""
+    parts = text.split('.')
+    if len(parts) != 4:
+        return False
+    for part in parts:
+        if not (part.isascii() and part.isdigit()) or len(part) > 3 or int(part) > 255:
+            return False
+    return int(parts[0]) != 0 and text != '255.255.255.255'
+
+
+def _is_port(text: str) -> bool:
+    """检查是否为有效端口号（1-65535）"""
+    return text.isdigit() and 1 <= int(text) <= 65535
+
+
+def _detect_protocol(text_lower: str, default: str = 'http') -> str:
+    """按优先级返回小写文本中出现的第一个协议关键字，均未出现时返回default"""
+    for protocol in PROTOCOL_PRIORITY:
+        if protocol in text_lower:
+            return protocol
+    return default
+
+
+def _js_unescape(text: str) -> str:
+    """还原JS单引号字符串字面量中的转义序列"""
+    def _replace(match):
+        esc = match.group(1)
+        if esc[0] in 'ux':
+            return chr(int(esc[1:], 16))
+        return {'n': '\n', 'r': '\r', 't': '\t'}.get(esc, esc)
+    return JS_ESCAPE_RE.sub(_replace, text)
+
+
+def _packer_encode(num: int, radix: int) -> str:
+    """p.a.c.k.e.r的关键字编号编码（等价于JS中的 y(c) 函数）"""
+    prefix = '' if num < radix else _packer_encode(num // radix, radix)
+    num %= radix
+    if num > 35:
+        return prefix + chr(num + 29)
+    return prefix + '0123456789abcdefghijklmnopqrstuvwxyz'[num]
+
+
+def unpack_packed_js(args: str) -> str:
+    """解包Dean Edwards p.a.c.k.e.r格式的JS代码
+
+    args 为 eval(function(p,r,o,x,y,s){...}(args)) 中的参数部分，
+    形如 'payload',60,60,'k1^k2^...'.split('\\u005e'),0,{}
+    """
+    match = PACKER_ARGS_RE.match(args.strip())
+    if not match:
+        raise ValueError("Could not parse packed arguments")
+
+    payload, radix, count, keywords, separator = match.groups()
+    payload = _js_unescape(payload)
+    radix = int(radix)
+    count = int(count)
+    keywords = _js_unescape(keywords).split(_js_unescape(separator))
+
+    symtab = {}
+    for i in range(count - 1, -1, -1):
+        key = _packer_encode(i, radix)
+        symtab[key] = keywords[i] if i < len(keywords) and keywords[i] else key
+
+    return JS_WORD_RE.sub(lambda m: symtab.get(m.group(0), m.group(0)), payload)
+
+
+# 使用spys_one项目中的cookies和headers（可能需要更新）
+SPYS_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
+    # 'Accept-Encoding': 'gzip, deflate, br, zstd',
+    'Sec-GPC': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Priority': 'u=0, i',
+}
 
-    return proxies
+# POST数据以获取500条代理
+SPYS_DATA = {
+    'xx00': '',
+    'xpp': '5',
+    'xf1': '0',
+    'xf2': '0',
+    'xf4': '0',
+    'xf5': '0',
+}
 
 
 def fetch_spys_one_proxies() -> List[str]:
     """从spys.one获取代理（使用JavaScript端口解码）"""
-    # 使用spys_one项目中的cookies和headers（可能需要更新）
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
-        # 'Accept-Encoding': 'gzip, deflate, br, zstd',
-        'Sec-GPC': '1',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-        'Sec-Fetch-User': '?1',
-        'Priority': 'u=0, i',
-    }
-
-    # POST数据以获取500条代理
-    data = {
-        'xx00': '',
-        'xpp': '5',
-        'xf1': '0',
-        'xf2': '0',
-        'xf4': '0',
-        'xf5': '0',
-    }
-
     countries = ["FR", "US", "RU", "HK", "JP", "BR", "SG", "ID", "FI", "TH", "CO", "MX"]
 
     class SpysOneCrawler:
-        def __init__(self, headers, timeout):
+        def __init__(self, session, headers, timeout):
+            self.session = session
             self.headers = headers
             self.timeout = timeout
-            self.vars_dict = None
+            # Decoded variables keyed by packed eval code; pages sharing a snapshot reuse them
+            self._vars_cache = {}
 
-        def fetch(self, url, data=None):
-            """Fetch page content, use POST if data provided"""
+        def fetch(self, url, data=None, headers=None):
+            """Fetch page content, use POST if data provided; headers override the defaults per call"""
+            headers = {**self.headers, **headers} if headers else self.headers
             if data:
-                resp = requests.post(url, headers=self.headers, data=data, timeout=self.timeout)
+                resp = self.session.post(url, headers=headers, data=data, timeout=self.timeout)
             else:
-                resp = requests.get(url, headers=self.headers, timeout=self.timeout)
+                resp = self.session.get(url, headers=headers, timeout=self.timeout)
             resp.raise_for_status()
-            return resp.text
+            return resp.content.decode('utf-8', errors='replace')
 
         def decode_port_variables(self, html):
             """Extract and decode JavaScript variables for port obfuscation"""
             # Find eval code
-            pattern = r'eval\(function\(p,r,o,x,y,s\)\{.*?\}\(.*?\)\)'
-            match = re.search(pattern, html, re.DOTALL)
+            match = EVAL_RE.search(html)
             if not match:
                 raise ValueError("Could not find eval code")
 
             eval_code = match.group(0)
+            cached = self._vars_cache.get(eval_code)
+            if cached is not None:
+                return cached
 
-            # Extract function and arguments
-            func_match = re.search(r"eval\(function\((.*?)\)\{(.*?)\}\((.*?)\)\)", eval_code, re.DOTALL)
+            # Extract function arguments
+            func_match = EVAL_PARSE_RE.search(eval_code)
             if not func_match:
                 raise ValueError("Could not parse eval function")
 
-            params, body, args = func_match.groups()
-
-            # Use js2py to unpack
-            context = js2py.EvalJs()
-            js_code = f"var unpack = function({params}) {{{body}}}; var result = unpack({args}); result;"
-            unpacked = context.eval(js_code)
-
-            # Execute unpacked code to set variables
-            context.execute(unpacked)
+            # 纯Python解包（p.a.c.k.e.r算法），无需JS解释器
+            unpacked = unpack_packed_js(func_match.group(1))
 
-            # Collect known variables
+            # 解析 var=值 / var=a^b 形式的赋值，按顺序求值
             vars_dict = {}
-            # Parse assignments from unpacked code
-            lines = unpacked.split(';')
-            for line in lines:
-                line = line.strip()
-                if '=' in line:
-                    var, expr = line.split('=', 1)
-                    var = var.strip()
-                    try:
-                        # Evaluate expression in context
-                        vars_dict[var] = context.eval(expr)
-                    except:
-                        pass
-
-            # Also get common variables directly
-            common_vars = [
-                'Two', 'Six', 'Four', 'Zero', 'Five', 'Nine', 'Three', 'Seven', 'Eight', 'One',
-                'SevenZeroFour', 'EightOneThree', 'Six9Six', 'NineEightNine', 'FiveOneZero',
-                'Four9One', 'ZeroTwoFive', 'Five6Seven', 'Nine5Two', 'Zero4Eight',
-                'Four4OneSeven', 'Eight5SevenNine', 'TwoSevenNineSix', 'Five2TwoZero',
-                'SixFiveThreeFive', 'OneFourEightTwo', 'Eight4FourThree', 'SevenTwoFiveOne',
-                'EightFourSixFour', 'OneOneZeroEight'
-            ]
-            for var in common_vars:
+            for statement in unpacked.split(';'):
+                if '=' not in statement:
+                    continue
+                var, expr = statement.split('=', 1)
+                value = 0
                 try:
-                    vars_dict[var] = context[var]
-                except:
-                    pass
+                    for operand in expr.split('^'):
+                        operand = operand.strip()
+                        value ^= int(operand) if operand.isdigit() else vars_dict[operand]
+                except KeyError:
+                    continue
+                vars_dict[var.strip()] = value
 
-            self.vars_dict = vars_dict
+            self._vars_cache[eval_code] = vars_dict
             return vars_dict
 
-        def evaluate_port_expression(self, expr):
+        def evaluate_port_expression(self, expr, vars_dict):
             """Evaluate port expression like (EightFourSixFour^Six9Six)+(Four4OneSeven^Five6Seven)"""
-            if not self.vars_dict:
+            if not vars_dict:
                 raise ValueError("Variables not decoded")
 
             # Find all XOR terms
-            terms = re.findall(r'\(([^)]+)\)', expr)
+            terms = PORT_EXPR_RE.findall(expr)
             port_parts = []
             for term in terms:
                 if '^' in term:
                     var1, var2 = term.split('^')
                     var1 = var1.strip()
                     var2 = var2.strip()
-                    val1 = self.vars_dict.get(var1)
-                    val2 = self.vars_dict.get(var2)
+                    val1 = vars_dict.get(var1)
+                    val2 = vars_dict.get(var2)
                     if val1 is None or val2 is None:
                         raise ValueError(f"Unknown variable: {var1} or {var2}")
-                    port_parts.append(str(val1 ^ val2))
+                    port_parts.append(str(int(val1) ^ int(val2)))
                 else:
                     # Might be a direct number? Not likely
                     pass
 
             return ''.join(port_parts)
 
-        def parse_proxies(self, html):
+        def parse_proxies(self, html, vars_dict):
             """Parse proxy list from HTML"""
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, HTML_PARSER)
             proxies = []
 
             # Find all table rows
@@ -446,24 +756,24 @@ def fetch_spys_one_proxies() -> List[str]:
                 ip = ip_text.split('<')[0] if '<' in ip_text else ip_text
 
                 # Validate IP format
-                if not re.match(r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}', ip):
+                if not _is_ipv4(ip):
                     continue
 
                 # Extract port expression
                 script_text = script.string
-                match = re.search(r'document\.write\(":"\s*\+\s*(.*)\)', script_text)
+                match = PORT_SCRIPT_RE.search(script_text)
                 if not match:
                     continue
 
                 expr = match.group(1)
                 try:
-                    port = self.evaluate_port_expression(expr)
+                    port = self.evaluate_port_expression(expr, vars_dict)
                 except Exception as e:
-                    print(f"Error evaluating port for {ip}: {e}")
+                    logger.warning("Error evaluating port for %s: %s", ip, e)
                     continue
 
                 # Extract proxy type (second column)
-                cols = row.find_all('td')
+                cols = row.find_all('td', limit=2)
                 if len(cols) < 2:
                     continue
 
@@ -483,759 +793,709 @@ def fetch_spys_one_proxies() -> List[str]:
                 else:
                     protocol = 'http'
 
-                proxies.append(f"{protocol}://{ip}:{port}")
+                proxies.append(PROTOCOL_PREFIX[protocol] + ip + ":" + port)
 
             return proxies
 
-        def crawl(self, url, data=None):
+        def crawl(self, url, data=None, headers=None):
             """Main crawl function"""
-            html = self.fetch(url, data=data)
-            self.decode_port_variables(html)
-            proxies = self.parse_proxies(html)
+            html = self.fetch(url, data=data, headers=headers)
+            vars_dict = self.decode_port_variables(html)
+            proxies = self.parse_proxies(html, vars_dict)
             return proxies
 
-    # 主爬取逻辑
-    all_proxies = []
+    # 主爬取逻辑：所有国家共用一个爬虫实例，共享已解码的端口变量
     total_countries = len(countries)
+    crawler = SpysOneCrawler(SESSION, SPYS_HEADERS, CONFIG["timeout"])
 
-    for i, country in enumerate(countries):
-        # 更新Referer头为当前国家
-        country_headers = headers.copy()
-        country_headers['Referer'] = f'https://spys.one/free-proxy-list/{country}/'
-
-        crawler = SpysOneCrawler(country_headers, CONFIG["timeout"])
+    def _crawl_country(indexed_country) -> List[str]:
+        i, country = indexed_country
         url = f'https://spys.one/free-proxy-list/{country}/'
         try:
-            proxies = crawler.crawl(url, data=data)
-            all_proxies.extend(proxies)
-            print(f"Spys.one {country}: 获取 {len(proxies)} 个代理 ({i+1}/{total_countries})")
+            # Referer按请求传入，不修改共享的headers
+            proxies = crawler.crawl(url, data=SPYS_DATA, headers={'Referer': url})
+            logger.info("Spys.one %s: 获取 %s 个代理 (%s/%s)", country, len(proxies), i+1, total_countries)
+            return proxies
         except Exception as e:
-            print(f"Spys.one {country} 爬取失败: {e}")
-            # 继续下一个国家
+            logger.warning("Spys.one %s 爬取失败: %s", country, e)
+            return []
+
+    # 各国家页面并发抓取
+    all_proxies = fetch_pages_concurrently(_crawl_country, enumerate(countries), max_workers=6)
 
-    print(f"Spys.one 总计: 获取 {len(all_proxies)} 个代理")
+    logger.info("Spys.one 总计: 获取 %s 个代理", len(all_proxies))
     return all_proxies
 
 
+IP89_COOKIES = {
+    'Hm_lvt_f9e56acddd5155c92b9b5499ff966848': '1769405985,1769487873',
+    'https_waf_cookie': '449ae721-b8f7-4e2788eb780605cb75da84a6951d6640f8bc',
+    'https_ydclearance': '9b7a0e30e98f253344b7cf2b-fd74-4005-892b-29dde2ea19da-1769495037',
+    'Hm_lpvt_f9e56acddd5155c92b9b5499ff966848': '1769488390',
+    'HMACCOUNT': 'E3C0C109BF9809D8',
+}
+
+IP89_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
+    'Connection': 'keep-alive',
+    'Referer': 'https://www.89ip.cn/',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'same-origin',
+    'Sec-Fetch-User': '?1',
+    'Priority': 'u=0, i',
+}
+
+
+IP89_URL = 'https://www.89ip.cn/index_{page}.html'
+IP89_MAX_PAGES = 6  # 爬取1-6页
+
+
+def _extract_89ip_proxies(html: str) -> List[str]:
+    """从89ip页面表格行提取代理"""
+    proxies = []
+    for match in TABLE_ROW_RE.finditer(html):
+        ip, port = match.group(1), match.group(2)
+        protocol = 'http'  # default
+        protocol_cell = (match.group(3) or '').lower()
+        if 'https' in protocol_cell:
+            protocol = 'https'
+        elif 'socks' in protocol_cell:
+            protocol = 'socks'
+        proxies.append(PROTOCOL_PREFIX[protocol] + ip + ":" + port)
+    return proxies
+
+
 def fetch_89ip_proxies() -> List[str]:
     """从89ip.cn获取代理"""
-    proxies = []
-    cookies = {
-        'Hm_lvt_f9e56acddd5155c92b9b5499ff966848': '1769405985,1769487873',
-        'https_waf_cookie': '449ae721-b8f7-4e2788eb780605cb75da84a6951d6640f8bc',
-        'https_ydclearance': '9b7a0e30e98f253344b7cf2b-fd74-4005-892b-29dde2ea19da-1769495037',
-        'Hm_lpvt_f9e56acddd5155c92b9b5499ff966848': '1769488390',
-        'HMACCOUNT': 'E3C0C109BF9809D8',
-    }
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
-        'Connection': 'keep-alive',
-        'Referer': 'https://www.89ip.cn/',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'same-origin',
-        'Sec-Fetch-User': '?1',
-        'Priority': 'u=0, i',
-    }
 
-    max_pages = 6  # 爬取1-6页
-    for page in range(1, max_pages + 1):
-        url = f'https://www.89ip.cn/index_{page}.html'
+    def _fetch_page(page: int) -> List[str]:
+        page_proxies = []
         try:
-            response = requests.get(url, cookies=cookies, headers=headers, timeout=CONFIG["timeout"])
+            response = SESSION.get(IP89_URL.format(page=page), cookies=IP89_COOKIES, headers=IP89_HEADERS, timeout=CONFIG["timeout"])
             if response.status_code == 200:
-                response.encoding = 'utf-8'
-                soup = BeautifulSoup(response.text, 'html.parser')
-                table = soup.find('table', class_='layui-table')
-                if not table:
-                    table = soup.find('table')
-                if not table:
-                    continue
-                rows = table.find_all('tr')
-                page_proxies = []
-                for row in rows:
-                    cols = row.find_all('td')
-                    if len(cols) >= 2:
-                        ip = cols[0].get_text(strip=True)
-                        port = cols[1].get_text(strip=True)
-                        protocol = 'http'  # default
-                        if len(cols) >= 3:
-                            protocol_cell = cols[2].get_text(strip=True).lower()
-                            if 'https' in protocol_cell:
-                                protocol = 'https'
-                            elif 'socks' in protocol_cell:
-                                protocol = 'socks'
-                        page_proxies.append(f"{protocol}://{ip}:{port}")
-                proxies.extend(page_proxies)
-                print(f"89ip 第 {page} 页: 获取 {len(page_proxies)} 个代理")
+                page_proxies = _extract_89ip_proxies(response.content.decode('utf-8', errors='replace'))
+                logger.info("89ip 第 %s 页: 获取 %s 个代理", page, len(page_proxies))
             else:
-                print(f"89ip 第 {page} 页请求失败 (HTTP {response.status_code})")
+                logger.warning("89ip 第 %s 页请求失败 (HTTP %s)", page, response.status_code)
         except Exception as e:
-            print(f"89ip 第 {page} 页爬取失败: {e}")
+            logger.warning("89ip 第 %s 页爬取失败: %s", page, e)
+        return page_proxies
+
+    return fetch_pages_concurrently(_fetch_page, range(1, IP89_MAX_PAGES + 1))
+
+
+IP3366_COOKIES = {
+    'Hm_lvt_c4dd741ab3585e047d56cf99ebbbe102': '1769405987,1769487848',
+    'http_waf_cookie': '21538523-28f4-4006bb5e3a9d94958ed9f778498d59aa0412',
+    'http_ydclearance': '139da8ff4b683447299ea746-791e-4686-9d03-90df3e211f08-1769495024',
+    'Hm_lpvt_c4dd741ab3585e047d56cf99ebbbe102': '1769487972',
+    'HMACCOUNT': 'EC176DE1D1C15F09',
+}
+
+IP3366_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Priority': 'u=0, i',
+}
+
+
+IP3366_URL = 'http://www.ip3366.net/'
+IP3366_MAX_PAGES = 7  # 1-7页
+IP3366_PAGE_WORKERS = 3  # 以有限并发代替逐页礼貌延迟
+
 
+def _extract_ip3366_proxies(html: str) -> List[str]:
+    """使用正则表达式从ip3366页面提取代理"""
+    proxies = []
+    for ip, port, protocol in IP3366_ROW_RE.findall(html):
+        protocol = protocol.strip().lower()
+        if protocol not in ('http', 'https'):
+            if 'https' in protocol:
+                protocol = 'https'
+            else:
+                protocol = 'http'
+        proxies.append(PROTOCOL_PREFIX[protocol] + ip + ":" + port)
     return proxies
 
 
 def fetch_ip3366_proxies() -> List[str]:
     """从ip3366.net获取代理"""
-    proxies = []
-    cookies = {
-        'Hm_lvt_c4dd741ab3585e047d56cf99ebbbe102': '1769405987,1769487848',
-        'http_waf_cookie': '21538523-28f4-4006bb5e3a9d94958ed9f778498d59aa0412',
-        'http_ydclearance': '139da8ff4b683447299ea746-791e-4686-9d03-90df3e211f08-1769495024',
-        'Hm_lpvt_c4dd741ab3585e047d56cf99ebbbe102': '1769487972',
-        'HMACCOUNT': 'EC176DE1D1C15F09',
-    }
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Priority': 'u=0, i',
-    }
 
-    max_pages = 7  # 1-7页
-    for page in range(1, max_pages + 1):
+    def _fetch_page(page: int) -> List[str]:
         params = {
             'stype': '1',
             'page': str(page),
         }
+        page_proxies = []
         try:
-            response = requests.get('http://www.ip3366.net/', params=params, cookies=cookies, headers=headers, timeout=CONFIG["timeout"])
+            response = SESSION.get(IP3366_URL, params=params, cookies=IP3366_COOKIES, headers=IP3366_HEADERS, timeout=CONFIG["timeout"])
             if response.status_code == 200:
-                response.encoding = 'utf-8'
-                # 使用正则表达式提取代理
-                import re
-                pattern = re.compile(r'<tr>\s*<td>([^<]+)</td>\s*<td>([^<]+)</td>\s*<td>[^<]+</td>\s*<td>([^<]+)</td>', re.IGNORECASE)
-                matches = pattern.findall(response.text)
-                page_proxies = []
-                for ip, port, protocol in matches:
-                    protocol = protocol.strip().lower()
-                    if protocol not in ('http', 'https'):
-                        if 'https' in protocol.lower():
-                            protocol = 'https'
-                        else:
-                            protocol = 'http'
-                    page_proxies.append(f"{protocol}://{ip}:{port}")
-                proxies.extend(page_proxies)
-                print(f"ip3366 第 {page} 页: 获取 {len(page_proxies)} 个代理")
+                page_proxies = _extract_ip3366_proxies(response.content.decode('utf-8', errors='replace'))
+                logger.info("ip3366 第 %s 页: 获取 %s 个代理", page, len(page_proxies))
             else:
-                print(f"ip3366 第 {page} 页请求失败 (HTTP {response.status_code})")
+                logger.warning("ip3366 第 %s 页请求失败 (HTTP %s)", page, response.status_code)
         except Exception as e:
-            print(f"ip3366 第 {page} 页爬取失败: {e}")
-        # 礼貌延迟
-        time.sleep(1)
+            logger.warning("ip3366 第 %s 页爬取失败: %s", page, e)
+        return page_proxies
+
+    return fetch_pages_concurrently(_fetch_page, range(1, IP3366_MAX_PAGES + 1), max_workers=IP3366_PAGE_WORKERS)
+
+
+KUAIDAILI_COOKIES = {
+    'channelid': '0',
+    'sid': '1769405911253474',
+    '_ss_s_uid': '472303e24f3eaa5b486647c73d70ce8f',
+    '_ga_DC1XM0P4JL': 'GS2.1.s1769487896$o2$g1$t1769489288$j60$l0$h0',
+    '_ga': 'GA1.1.776303152.1769406093',
+    '_gcl_au': '1.1.919442339.1769406093',
+    '_uetsid': '95fd0540fa7911f096430956bc926384|obrp2f|2|g32|0|2217',
+    '_uetvid': '95fcf930fa7911f0af0c178f9c85ce6f|1w2t3le|1769489259162|9|1|bat.bing.com/p/conversions/c/h',
+}
 
+KUAIDAILI_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Priority': 'u=0, i',
+}
+
+
+KUAIDAILI_BASE_URLS = [
+    'https://www.kuaidaili.com/free/dps/',  # 国内私密代理
+    'https://www.kuaidaili.com/free/fps/',  # 国外代理
+]
+# 每类爬取3页，以有限并发代替逐页礼貌延迟
+KUAIDAILI_PAGE_SPECS = [(base_url, page) for base_url in KUAIDAILI_BASE_URLS for page in range(1, 4)]
+KUAIDAILI_PAGE_WORKERS = 3
+
+
+def _extract_kuaidaili_proxies(html: str) -> List[str]:
+    """从kuaidaili页面表格行提取代理"""
+    proxies = []
+    for match in KUAIDAILI_ROW_RE.finditer(html):
+        ip, port, protocol_raw = match.groups()
+        if 'https' in protocol_raw.lower():
+            protocol = 'https'
+        else:
+            protocol = 'http'
+        proxies.append(PROTOCOL_PREFIX[protocol] + ip + ":" + port)
     return proxies
 
 
 def fetch_kuaidaili_proxies() -> List[str]:
     """从kuaidaili.com获取代理"""
-    proxies = []
-    cookies = {
-        'channelid': '0',
-        'sid': '1769405911253474',
-        '_ss_s_uid': '472303e24f3eaa5b486647c73d70ce8f',
-        '_ga_DC1XM0P4JL': 'GS2.1.s1769487896$o2$g1$t1769489288$j60$l0$h0',
-        '_ga': 'GA1.1.776303152.1769406093',
-        '_gcl_au': '1.1.919442339.1769406093',
-        '_uetsid': '95fd0540fa7911f096430956bc926384|obrp2f|2|g32|0|2217',
-        '_uetvid': '95fcf930fa7911f0af0c178f9c85ce6f|1w2t3le|1769489259162|9|1|bat.bing.com/p/conversions/c/h',
-    }
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-        'Sec-Fetch-User': '?1',
-        'Priority': 'u=0, i',
-    }
 
-    base_urls = [
-        'https://www.kuaidaili.com/free/dps/',  # 国内私密代理
-        'https://www.kuaidaili.com/free/fps/',  # 国外代理
-    ]
+    def _fetch_page(page_spec) -> List[str]:
+        base_url, page = page_spec
+        url = f"{base_url}{page}"
+        page_proxies = []
+        try:
+            response = SESSION.get(url, cookies=KUAIDAILI_COOKIES, headers=KUAIDAILI_HEADERS, timeout=CONFIG["timeout"])
+            if response.status_code == 200:
+                page_proxies = _extract_kuaidaili_proxies(response.content.decode('utf-8', errors='replace'))
+                logger.info("kuaidaili %s 第 %s 页: 获取 %s 个代理", base_url, page, len(page_proxies))
+            else:
+                logger.warning("kuaidaili %s 第 %s 页请求失败 (HTTP %s)", base_url, page, response.status_code)
+        except Exception as e:
+            logger.warning("kuaidaili %s 第 %s 页爬取失败: %s", base_url, page, e)
+        return page_proxies
 
-    for base_url in base_urls:
-        for page in range(1, 4):  # 每类爬取3页
-            url = f"{base_url}{page}"
-            try:
-                response = requests.get(url, cookies=cookies, headers=headers, timeout=CONFIG["timeout"])
-                if response.status_code == 200:
-                    response.encoding = 'utf-8'
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    page_proxies = []
-                    tbody = soup.find('tbody', class_='kdl-table-tbody')
-                    if tbody:
-                        rows = tbody.find_all('tr')
-                        for row in rows:
-                            cols = row.find_all('td', class_='kdl-table-cell')
-                            if len(cols) >= 4:
-                                ip = cols[0].get_text(strip=True)
-                                port = cols[1].get_text(strip=True)
-                                protocol_raw = cols[3].get_text(strip=True).lower()
-                                if 'https' in protocol_raw:
-                                    protocol = 'https'
-                                else:
-                                    protocol = 'http'
-                                page_proxies.append(f"{protocol}://{ip}:{port}")
-                    proxies.extend(page_proxies)
-                    print(f"kuaidaili {base_url} 第 {page} 页: 获取 {len(page_proxies)} 个代理")
-                else:
-                    print(f"kuaidaili {base_url} 第 {page} 页请求失败 (HTTP {response.status_code})")
-            except Exception as e:
-                print(f"kuaidaili {base_url} 第 {page} 页爬取失败: {e}")
-            # 礼貌延迟
-            time.sleep(1)
+    return fetch_pages_concurrently(_fetch_page, KUAIDAILI_PAGE_SPECS, max_workers=KUAIDAILI_PAGE_WORKERS)
+
+
+# 第一个请求的cookies (Socks列表)
+PROXYLISTPLUS_SOCKS_COOKIES = {
+    '_ga': 'GA1.2.199902941.1769488698',
+    '_gid': 'GA1.2.892468389.1769488698',
+    'cf_clearance': 'lJascryu2nrvuIiF0ak8WWr_TcBT61iK.f3lpF4KYbs-1769488721-1.2.1.1-MoNvY8ciQ2diFQrlebimLR8jinVzWgnhC5V_sRaG8ipDG_OdQpc5Gs8ZhBQC07jHMI7VyXgAKentTFYgIuZkbvpD5wjW81DDXppVPOWInsFkM9.8jjdHxZUUl_mP4MeKqsGzO461kLWKdrFjytUW47SY.TYLliD2UFR0h4E16Y4GnJNcuHUpj0rR084dxdkWER2BAOFtb0yK0wEMATwfAHoNboRGV8cdBkSTqDONMkU',
+    '_no_tracky_100814458': '1',
+    '_ga_Z3MSCTK1RG': 'GS2.2.s1769488703$o1$g1$t1769488725$j38$l0$h0',
+}
+
+# 第二个请求的cookies (HTTP列表)
+PROXYLISTPLUS_HTTP_COOKIES = {
+    **PROXYLISTPLUS_SOCKS_COOKIES,
+    '_ga_Z3MSCTK1RG': 'GS2.2.s1769488703$o1$g1$t1769488861$j60$l0$h0',
+    '_gat': '1',
+}
 
-    # 去重
-    unique_proxies = list(set(proxies))
-    return unique_proxies
+PROXYLISTPLUS_SOCKS_URL = 'https://list.proxylistplus.com/Socks-List-1'
+PROXYLISTPLUS_HTTP_URL = 'https://list.proxylistplus.com/Fresh-HTTP-Proxy-List-1'
+
+PROXYLISTPLUS_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+}
 
 
 def fetch_proxylistplus_proxies() -> List[str]:
     """从proxylistplus.com获取代理"""
-    proxies = []
-    # 第一个请求的cookies和headers (Socks列表)
-    cookies1 = {
-        '_ga': 'GA1.2.199902941.1769488698',
-        '_gid': 'GA1.2.892468389.1769488698',
-        'cf_clearance': 'lJascryu2nrvuIiF0ak8WWr_TcBT61iK.f3lpF4KYbs-1769488721-1.2.1.1-MoNvY8ciQ2diFQrlebimLR8jinVzWgnhC5V_sRaG8ipDG_OdQpc5Gs8ZhBQC07jHMI7VyXgAKentTFYgIuZkbvpD5wjW81DDXppVPOWInsFkM9.8jjdHxZUUl_mP4MeKqsGzO461kLWKdrFjytUW47SY.TYLliD2UFR0h4E16Y4GnJNcuHUpj0rR084dxdkWER2BAOFtb0yK0wEMATwfAHoNboRGV8cdBkSTqDONMkU',
-        '_no_tracky_100814458': '1',
-        '_ga_Z3MSCTK1RG': 'GS2.2.s1769488703$o1$g1$t1769488725$j38$l0$h0',
-    }
-    # 第二个请求的cookies和headers (HTTP列表)
-    cookies2 = cookies1.copy()
-    cookies2['_ga_Z3MSCTK1RG'] = 'GS2.2.s1769488703$o1$g1$t1769488861$j60$l0$h0'
-    cookies2['_gat'] = '1'
-
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-        'Sec-Fetch-User': '?1',
-    }
+    proxies: Set[str] = set()
 
     # 爬取Socks代理列表
     try:
-        response = requests.get('https://list.proxylistplus.com/Socks-List-1', cookies=cookies1, headers=headers, timeout=CONFIG["timeout"])
+        response = SESSION.get(PROXYLISTPLUS_SOCKS_URL, cookies=PROXYLISTPLUS_SOCKS_COOKIES, headers=PROXYLISTPLUS_HEADERS, timeout=CONFIG["timeout"])
         if response.status_code == 200:
-            socks_proxies = _extract_proxylistplus_proxies(response.text, default_protocol="socks")
-            proxies.extend(socks_proxies)
-            print(f"proxylistplus Socks: 获取 {len(socks_proxies)} 个代理")
+            socks_proxies = _extract_proxylistplus_proxies(response.content.decode('utf-8', errors='replace'), default_protocol="socks")
+            proxies.update(socks_proxies)
+            logger.info("proxylistplus Socks: 获取 %s 个代理", len(socks_proxies))
     except Exception as e:
-        print(f"proxylistplus Socks爬取失败: {e}")
+        logger.warning("proxylistplus Socks爬取失败: %s", e)
 
     # 爬取HTTP代理列表
     try:
-        response = requests.get('https://list.proxylistplus.com/Fresh-HTTP-Proxy-List-1', cookies=cookies2, headers=headers, timeout=CONFIG["timeout"])
+        response = SESSION.get(PROXYLISTPLUS_HTTP_URL, cookies=PROXYLISTPLUS_HTTP_COOKIES, headers=PROXYLISTPLUS_HEADERS, timeout=CONFIG["timeout"])
         if response.status_code == 200:
-            http_proxies = _extract_proxylistplus_proxies(response.text, default_protocol="http")
-            proxies.extend(http_proxies)
-            print(f"proxylistplus HTTP: 获取 {len(http_proxies)} 个代理")
+            http_proxies = _extract_proxylistplus_proxies(response.content.decode('utf-8', errors='replace'), default_protocol="http")
+            proxies.update(http_proxies)
+            logger.info("proxylistplus HTTP: 获取 %s 个代理", len(http_proxies))
     except Exception as e:
-        print(f"proxylistplus HTTP爬取失败: {e}")
+        logger.warning("proxylistplus HTTP爬取失败: %s", e)
 
-    return proxies
+    return list(proxies)
 
 def _extract_proxylistplus_proxies(html, default_protocol="http"):
     """从proxylistplus HTML中提取代理（内部辅助函数）"""
-    if not html:
-        return []
-    import re
-    soup = BeautifulSoup(html, 'lxml')
     proxies = []
-    tables = soup.find_all('table')
-    for table in tables:
-        rows = table.find_all('tr')
-        for row in rows:
-            cols = row.find_all('td')
-            if len(cols) < 2:
-                continue
-            ip = None
-            port = None
-            protocol = default_protocol
-            # 方法1: 查找IP地址列
-            for i, col in enumerate(cols):
-                text = col.get_text(strip=True)
-                if re.match(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$', text):
-                    ip = text
-                    for offset in [1, -1, 2, -2]:
+    for cols in iter_table_rows(html):
+        if len(cols) < 2:
+            continue
+        ip = None
+        port = None
+        # 查找IP地址列，端口通常紧随其后；否则再查找附近的数字列
+        for i, text in enumerate(cols):
+            if _is_ipv4(text):
+                ip = text
+                if i + 1 < len(cols) and _is_port(cols[i + 1]):
+                    port = cols[i + 1]
+                else:
+                    for offset in (-1, 2, -2):
                         idx = i + offset
-                        if 0 <= idx < len(cols):
-                            port_text = cols[idx].get_text(strip=True)
-                            if port_text.isdigit() and 1 <= int(port_text) <= 65535:
-                                port = port_text
-                                break
-                    break
-            # 方法2: 假设前两列是IP和端口
-            if not ip and len(cols) >= 2:
-                col1 = cols[0].get_text(strip=True)
-                col2 = cols[1].get_text(strip=True)
-                if re.match(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$', col1) and col2.isdigit():
-                    ip = col1
-                    port = col2
-            if ip and port:
-                for col in cols:
-                    text = col.get_text(strip=True).lower()
-                    if 'socks4' in text:
-                        protocol = 'socks4'
-                        break
-                    elif 'socks5' in text:
-                        protocol = 'socks5'
-                        break
-                    elif 'socks' in text:
-                        protocol = 'socks'
-                    elif 'https' in text:
-                        protocol = 'https'
-                    elif 'http' in text:
-                        protocol = 'http'
-                proxies.append(f"{protocol}://{ip}:{port}")
+                        if 0 <= idx < len(cols) and _is_port(cols[idx]):
+                            port = cols[idx]
+                            break
+                break
+        if ip and port:
+            # 整行文本只拼接一次，按优先级检查协议关键字
+            protocol = _detect_protocol(' '.join(cols).lower(), default_protocol)
+            proxies.append(PROTOCOL_PREFIX[protocol] + ip + ":" + port)
+    return proxies
+
+
+UU_PROXY_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
+    'Connection': 'keep-alive',
+    'Referer': 'https://uu-proxy.com/',
+    'Sec-Fetch-Dest': 'empty',
+    'Sec-Fetch-Mode': 'cors',
+    'Sec-Fetch-Site': 'same-origin',
+}
+
+
+UU_PROXY_URL = 'https://uu-proxy.com/api/free'
+
+
+def _extract_uu_proxy_proxies(data) -> Optional[List[str]]:
+    """从uu-proxy API返回的JSON中提取代理，返回不成功或数据缺失时返回None"""
+    if not (data.get('success') and 'free' in data and 'proxies' in data['free']):
+        return None
+    proxies = []
+    for proxy in data['free']['proxies']:
+        ip = proxy.get('ip')
+        port = proxy.get('port')
+        scheme = proxy.get('scheme')
+        if ip and port and scheme:
+            proxies.append(f"{scheme}://{ip}:{port}")
     return proxies
 
 
 def fetch_uu_proxy_proxies() -> List[str]:
     """从uu-proxy.com获取代理"""
-    proxies = []
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
-        'Accept': 'application/json, text/plain, */*',
-        'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
-        'Connection': 'keep-alive',
-        'Referer': 'https://uu-proxy.com/',
-        'Sec-Fetch-Dest': 'empty',
-        'Sec-Fetch-Mode': 'cors',
-        'Sec-Fetch-Site': 'same-origin',
-    }
+    proxies: Set[str] = set()
     try:
-        response = requests.get('https://uu-proxy.com/api/free', headers=headers, timeout=CONFIG["timeout"])
+        response = SESSION.get(UU_PROXY_URL, headers=UU_PROXY_HEADERS, timeout=CONFIG["timeout"])
         if response.status_code == 200:
-            data = response.json()
-            if data.get('success') and 'free' in data and 'proxies' in data['free']:
-                proxy_list = data['free']['proxies']
-                for proxy in proxy_list:
-                    ip = proxy.get('ip')
-                    port = proxy.get('port')
-                    scheme = proxy.get('scheme')
-                    if ip and port and scheme:
-                        proxies.append(f"{scheme}://{ip}:{port}")
-                print(f"uu-proxy: 获取 {len(proxies)} 个代理")
+            data = json_loads(response.content)
+            found = _extract_uu_proxy_proxies(data)
+            if found is not None:
+                proxies.update(found)
+                logger.info("uu-proxy: 获取 %s 个代理", len(proxies))
             else:
-                print(f"uu-proxy API返回不成功或数据缺失: {data}")
+                logger.warning("uu-proxy API返回不成功或数据缺失: %s", data)
         else:
-            print(f"uu-proxy 请求失败 (HTTP {response.status_code})")
+            logger.warning("uu-proxy 请求失败 (HTTP %s)", response.status_code)
     except Exception as e:
-        print(f"uu-proxy爬取失败: {e}")
+        logger.warning("uu-proxy爬取失败: %s", e)
 
-    return proxies
+    return list(proxies)
+
+
+FREE_PROXY_LIST_GITHUB_URLS = {
+    'http': 'https://raw.githubusercontent.com/databay-labs/free-proxy-list/refs/heads/master/http.txt',
+    'socks5': 'https://raw.githubusercontent.com/databay-labs/free-proxy-list/refs/heads/master/socks5.txt',
+    'https': 'https://raw.githubusercontent.com/databay-labs/free-proxy-list/refs/heads/master/https.txt'
+}
+
+
+def _extract_free_proxy_list_github_proxies(data: bytes, protocol: str) -> List[str]:
+    """databay-labs列表每行一个ip:port"""
+    prefix = PROTOCOL_PREFIX[protocol]
+    return [prefix + ip.decode('ascii') + ":" + port.decode('ascii')
+            for ip, port in IP_PORT_BYTES_RE.findall(data)]
 
 
 def fetch_free_proxy_list_github() -> List[str]:
     """从databay-labs/free-proxy-list GitHub仓库获取代理"""
-    proxies = []
-    urls = {
-        'http': 'https://raw.githubusercontent.com/databay-labs/free-proxy-list/refs/heads/master/http.txt',
-        'socks5': 'https://raw.githubusercontent.com/databay-labs/free-proxy-list/refs/heads/master/socks5.txt',
-        'https': 'https://raw.githubusercontent.com/databay-labs/free-proxy-list/refs/heads/master/https.txt'
-    }
 
-    for protocol, url in urls.items():
+    def _fetch_list(item) -> List[str]:
+        protocol, url = item
         try:
-            response = requests.get(url, timeout=CONFIG["timeout"])
+            response = SESSION.get(url, timeout=CONFIG["timeout"])
             response.raise_for_status()
+            list_proxies = _extract_free_proxy_list_github_proxies(response.content, protocol)
 
-            lines = response.text.strip().split('\n')
-            count = 0
+            logger.info("Free Proxy List GitHub %s: 获取 %s 个代理", protocol, len(list_proxies))
+            return list_proxies
 
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
+        except Exception as e:
+            logger.warning("Free Proxy List GitHub %s 爬取失败: %s", protocol, e)
+            return []
+
+    return fetch_pages_concurrently(_fetch_list, FREE_PROXY_LIST_GITHUB_URLS.items())
+
+
+NODEMAVEN_COOKIES = {
+    '_gcl_au': '1.1.395836628.1769490509',
+    'burst_uid': 'ecb17473968de00b4a2cfdb597d09235',
+    'usetiful-visitor-ident': 'cd16cf01-63f0-4751-3c6a-a9c186a720b6',
+    '_ga_TWZ9W1JNF7': 'GS2.1.s1769490514$o1$g1$t1769490666$j60$l0$h1214679402',
+    '_ga': 'GA1.1.938034495.1769490515',
+    '_ga_33JL89XFQ5': 'GS2.1.s1769490514$o1$g1$t1769490666$j60$l0$h949295014',
+    'pys_session_limit': 'true',
+    'pys_start_session': 'true',
+    'pys_first_visit': 'true',
+    'pysTrafficSource': 'google.com',
+    'pys_landing_page': 'https://nodemaven.com/free-proxy-list/',
+    'last_pysTrafficSource': 'google.com',
+    'last_pys_landing_page': 'https://nodemaven.com/free-proxy-list/',
+    'PAPVisitorId': 'NQOsAK66LrOZFB1lgf6zPyADtLjKUNvW',
+    '_uetsid': '407aa4f0fb3e11f08e02df65b0a9dcf4',
+    '_uetvid': '407a8c60fb3e11f0b62d07e6397ed1bf',
+    '_ym_uid': '1769490524954226209',
+    '_ym_d': '1769490524',
+    '_ym_isad': '2',
+    'intercom-id-yvkc0rpk': '38d805d8-fd48-40ec-a593-93081a40a772',
+    'intercom-session-yvkc0rpk': '',
+    'intercom-device-id-yvkc0rpk': 'df456bee-a130-4b86-83ce-b90d5e295b75',
+    '_ym_visorc': 'w',
+    'AMP_29d2d968b7': 'JTdCJTIyZGV2aWNlSWQlMjIlM0ElMjIxNGU4YWEyZi0zODc3LTQ4N2EtYTdhNS02NjJmZWQ3ODVlNmQlMjIlMkMlMjJzZXNzaW9uSWQlMjIlM0ExNzY5NDkwNTI2MDgwJTJDJTIyb3B0T3V0JTIyJTNBZmFsc2UlMkMlMjJsYXN0RXZlbnRUaW1lJTIyJTNBMTc2OTQ5MDUzMDk5MCUyQyUyMmxhc3RFdmVudElkJTIyJTNBNCUyQyUyMnBhZ2VDb3VudGVyJTIyJTNBMSU3RA==',
+    'AMP_MKTG_29d2d968b7': 'JTdCJTIycmVmZXJyZXIlMjIlM0ElMjJodHRwcyUzQSUyRiUyRnd3dy5nb29nbGUuY29tJTJGJTIyJTJDJTIycmVmZXJyaW5nX2RvbWFpbiUyMiUzQSUyMnd3dy5nb29nbGUuY29tJTIyJTdE',
+    '_clck': 'kwugn8%5E2%5Eg32%5E0%5E2218',
+    '_clsk': '1ohse77%5E1769490535520%5E1%5E1%5Eh.clarity.ms%2Fcollect',
+}
 
-                # Parse ip:port format
-                parts = line.split(':')
-                if len(parts) >= 2:
-                    ip = parts[0].strip()
-                    port = parts[1].strip()
+NODEMAVEN_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
+    'Accept': 'application/json, text/javascript, */*; q=0.01',
+    'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
+    'X-Requested-With': 'XMLHttpRequest',
+    'Connection': 'keep-alive',
+    'Referer': 'https://nodemaven.com/free-proxy-list/',
+    'Sec-Fetch-Dest': 'empty',
+    'Sec-Fetch-Mode': 'cors',
+    'Sec-Fetch-Site': 'same-origin',
+}
 
-                    # Simple validation
-                    if ip and port and port.isdigit():
-                        proxy = f"{protocol}://{ip}:{port}"
-                        proxies.append(proxy)
-                        count += 1
 
-            print(f"Free Proxy List GitHub {protocol}: 获取 {count} 个代理")
+NODEMAVEN_URL = 'https://nodemaven.com/wp-json/proxy-list/v1/proxies'
+NODEMAVEN_PARAMS = {
+    'per_page': '100',
+    'country': '',
+    'protocol': '',
+    'type': '',
+    'latency': '',
+}
+NODEMAVEN_MAX_PAGES = 5
+NODEMAVEN_PAGE_WORKERS = 3  # 同一站点限制为3个并发，代替逐页顺序请求
 
-        except Exception as e:
-            print(f"Free Proxy List GitHub {protocol} 爬取失败: {e}")
 
+def _extract_nodemaven_proxies(data) -> List[str]:
+    """从nodemaven API返回的JSON中提取代理"""
+    proxies = []
+    # Response is a dict with 'proxies' key
+    if isinstance(data, dict) and 'proxies' in data:
+        for proxy in data['proxies']:
+            ip = proxy.get('ip_address')
+            port = proxy.get('port')
+            protocol = proxy.get('protocol')
+            if ip and port and protocol:
+                # Convert protocol to lowercase for standard format
+                protocol_lower = protocol.lower()
+                proxies.append(f"{protocol_lower}://{ip}:{port}")
     return proxies
 
 
 def fetch_nodemaven_proxies() -> List[str]:
     """从nodemaven.com获取代理"""
-    proxies = []
-    cookies = {
-        '_gcl_au': '1.1.395836628.1769490509',
-        'burst_uid': 'ecb17473968de00b4a2cfdb597d09235',
-        'usetiful-visitor-ident': 'cd16cf01-63f0-4751-3c6a-a9c186a720b6',
-        '_ga_TWZ9W1JNF7': 'GS2.1.s1769490514$o1$g1$t1769490666$j60$l0$h1214679402',
-        '_ga': 'GA1.1.938034495.1769490515',
-        '_ga_33JL89XFQ5': 'GS2.1.s1769490514$o1$g1$t1769490666$j60$l0$h949295014',
-        'pys_session_limit': 'true',
-        'pys_start_session': 'true',
-        'pys_first_visit': 'true',
-        'pysTrafficSource': 'google.com',
-        'pys_landing_page': 'https://nodemaven.com/free-proxy-list/',
-        'last_pysTrafficSource': 'google.com',
-        'last_pys_landing_page': 'https://nodemaven.com/free-proxy-list/',
-        'PAPVisitorId': 'NQOsAK66LrOZFB1lgf6zPyADtLjKUNvW',
-        '_uetsid': '407aa4f0fb3e11f08e02df65b0a9dcf4',
-        '_uetvid': '407a8c60fb3e11f0b62d07e6397ed1bf',
-        '_ym_uid': '1769490524954226209',
-        '_ym_d': '1769490524',
-        '_ym_isad': '2',
-        'intercom-id-yvkc0rpk': '38d805d8-fd48-40ec-a593-93081a40a772',
-        'intercom-session-yvkc0rpk': '',
-        'intercom-device-id-yvkc0rpk': 'df456bee-a130-4b86-83ce-b90d5e295b75',
-        '_ym_visorc': 'w',
-        'AMP_29d2d968b7': 'JTdCJTIyZGV2aWNlSWQlMjIlM0ElMjIxNGU4YWEyZi0zODc3LTQ4N2EtYTdhNS02NjJmZWQ3ODVlNmQlMjIlMkMlMjJzZXNzaW9uSWQlMjIlM0ExNzY5NDkwNTI2MDgwJTJDJTIyb3B0T3V0JTIyJTNBZmFsc2UlMkMlMjJsYXN0RXZlbnRUaW1lJTIyJTNBMTc2OTQ5MDUzMDk5MCUyQyUyMmxhc3RFdmVudElkJTIyJTNBNCUyQyUyMnBhZ2VDb3VudGVyJTIyJTNBMSU3RA==',
-        'AMP_MKTG_29d2d968b7': 'JTdCJTIycmVmZXJyZXIlMjIlM0ElMjJodHRwcyUzQSUyRiUyRnd3dy5nb29nbGUuY29tJTJGJTIyJTJDJTIycmVmZXJyaW5nX2RvbWFpbiUyMiUzQSUyMnd3dy5nb29nbGUuY29tJTIyJTdE',
-        '_clck': 'kwugn8%5E2%5Eg32%5E0%5E2218',
-        '_clsk': '1ohse77%5E1769490535520%5E1%5E1%5Eh.clarity.ms%2Fcollect',
-    }
-
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
-        'Accept': 'application/json, text/javascript, */*; q=0.01',
-        'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
-        'X-Requested-With': 'XMLHttpRequest',
-        'Connection': 'keep-alive',
-        'Referer': 'https://nodemaven.com/free-proxy-list/',
-        'Sec-Fetch-Dest': 'empty',
-        'Sec-Fetch-Mode': 'cors',
-        'Sec-Fetch-Site': 'same-origin',
-    }
 
-    base_params = {
-        'per_page': '100',
-        'country': '',
-        'protocol': '',
-        'type': '',
-        'latency': '',
-    }
-
-    for page in range(1, 6):
-        params = base_params.copy()
-        params['page'] = str(page)
+    def _fetch_page(page: int) -> List[str]:
+        params = {**NODEMAVEN_PARAMS, 'page': str(page)}
         try:
-            response = requests.get('https://nodemaven.com/wp-json/proxy-list/v1/proxies',
-                                  params=params, cookies=cookies, headers=headers, timeout=CONFIG["timeout"])
+            response = SESSION.get(NODEMAVEN_URL, params=params, cookies=NODEMAVEN_COOKIES,
+                                   headers=NODEMAVEN_HEADERS, timeout=CONFIG["timeout"])
             response.raise_for_status()
-            data = response.json()
-            # Response is a dict with 'proxies' key
-            if isinstance(data, dict) and 'proxies' in data:
-                proxy_list = data['proxies']
-                count = 0
-                for proxy in proxy_list:
-                    ip = proxy.get('ip_address')
-                    port = proxy.get('port')
-                    protocol = proxy.get('protocol')
-                    if ip and port and protocol:
-                        # Convert protocol to lowercase for standard format
-                        protocol_lower = protocol.lower()
-                        proxies.append(f"{protocol_lower}://{ip}:{port}")
-                        count += 1
-                print(f"Nodemaven 第 {page} 页: 获取 {count} 个代理")
+            page_proxies = _extract_nodemaven_proxies(json_loads(response.content))
+            logger.info("Nodemaven 第 %s 页: 获取 %s 个代理", page, len(page_proxies))
+            return page_proxies
         except Exception as e:
-            print(f"Nodemaven 第 {page} 页爬取失败: {e}")
-
-    return proxies
+            logger.warning("Nodemaven 第 %s 页爬取失败: %s", page, e)
+            return []
+
+    return fetch_pages_concurrently(_fetch_page, range(1, NODEMAVEN_MAX_PAGES + 1),
+                                    max_workers=NODEMAVEN_PAGE_WORKERS)
+
+
+FREEPROXY_WORLD_COOKIES = {
+    '_ga': 'GA1.1.1442368388.1769491256',
+    '_gid': 'GA1.2.426402489.1769491256',
+    '_ga_H19S2TE1ZB': 'GS2.1.s1769491256$o1$g1$t1769491958$j57$l0$h0',
+    'cf_clearance': 'Z4_FxYLcTmVfovjVLRFgKSoIALWHiM1x8VuSOcxCYJg-1769491253-1.2.1.1-GMWlvnlWijcH9nGG82i6L2EzKa44X02mxHf9aj.Jx48B16QL4yY1aIPptpym1DeSV0FP1ITwtnxaos2eDCXY0D0MC.PzWhXTyhkiGiS1jQ_VeOph8wZqenZp1epVu6lbLK1bj9mtQ1gBwMYY2Wcl6yloWTNTkDY_P9OiCd.gfp2BbSZy3BKW1yp9x86H2xLqGv03camFsXWNGj6J0ukdoIco1yIdOIebOqAaKSfpdTA',
+    '__gads': 'ID=9318efd53294ee26:T=1769491256:RT=1769491677:S=ALNI_MZVYWcWakVX-hy7VlpQXjxR_M3NJA',
+    '__gpi': 'UID=00001332563e516b:T=1769491256:RT=1769491677:S=ALNI_MYgbvtqWNUstYh-TWnUkR2lRB1hKQ',
+    '__eoi': 'ID=b7d19480640f7333:T=1769491256:RT=1769491677:S=AA-Afjbh0pNtJX5wgKDR75m2qVaT',
+    'FCCDCF': '%5Bnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2C%5B%5B32%2C%22%5B%5C%229c4ce7b4-b0eb-4267-b922-5efd65d3c3a3%5C%22%2C%5B1769491265%2C414000000%5D%5D%22%5D%5D%5D',
+    'FCOEC': '%5B%5B%5B28%2C%22%5Bnull%2C%5Bnull%2C0%2C%5B1769491944%2C111942000%5D%2C1%5D%5D%22%5D]5D%5D',
+    'FCNEC': '%5B%5B%22AKsRol9C7GvJ5Z8SXUljQI5dnaFlHAS7P9ThzH7M3x6csHsP9Clxjpvw92UU2b-ermqlGcTe9bKXspyq_cg1CyGX78jk3m-EVr-ryES6QhRhLyZB9H-6ychrFn30-lrO2joK4HVD8k-cdff6mhfyzmbPUvFfX3BxmQ%3D%3D%22%5D%2Cnull%2C%5B%5B21%2C%22%5B%5B%5B%5B5%2C1%2C%5B0%5D%5D%2C%5B1769491269%2C704339000%5D%2C%5B1209600%5D%5D%5D%5D%22%5D]5D%5D',
+    '_gat_gtag_UA_138692554_2': '1',
+}
 
+FREEPROXY_WORLD_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Priority': 'u=0, i',
+}
 
-def fetch_freeproxy_world_proxies() -> List[str]:
-    """从freeproxy.world获取代理"""
-    proxies = []
-    cookies = {
-        '_ga': 'GA1.1.1442368388.1769491256',
-        '_gid': 'GA1.2.426402489.1769491256',
-        '_ga_H19S2TE1ZB': 'GS2.1.s1769491256$o1$g1$t1769491958$j57$l0$h0',
-        'cf_clearance': 'Z4_FxYLcTmVfovjVLRFgKSoIALWHiM1x8VuSOcxCYJg-1769491253-1.2.1.1-GMWlvnlWijcH9nGG82i6L2EzKa44X02mxHf9aj.Jx48B16QL4yY1aIPptpym1DeSV0FP1ITwtnxaos2eDCXY0D0MC.PzWhXTyhkiGiS1jQ_VeOph8wZqenZp1epVu6lbLK1bj9mtQ1gBwMYY2Wcl6yloWTNTkDY_P9OiCd.gfp2BbSZy3BKW1yp9x86H2xLqGv03camFsXWNGj6J0ukdoIco1yIdOIebOqAaKSfpdTA',
-        '__gads': 'ID=9318efd53294ee26:T=1769491256:RT=1769491677:S=ALNI_MZVYWcWakVX-hy7VlpQXjxR_M3NJA',
-        '__gpi': 'UID=00001332563e516b:T=1769491256:RT=1769491677:S=ALNI_MYgbvtqWNUstYh-TWnUkR2lRB1hKQ',
-        '__eoi': 'ID=b7d19480640f7333:T=1769491256:RT=1769491677:S=AA-Afjbh0pNtJX5wgKDR75m2qVaT',
-        'FCCDCF': '%5Bnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2C%5B%5B32%2C%22%5B%5C%229c4ce7b4-b0eb-4267-b922-5efd65d3c3a3%5C%22%2C%5B1769491265%2C414000000%5D%5D%22%5D%5D%5D',
-        'FCOEC': '%5B%5B%5B28%2C%22%5Bnull%2C%5Bnull%2C0%2C%5B1769491944%2C111942000%5D%2C1%5D%5D%22%5D]5D%5D',
-        'FCNEC': '%5B%5B%22AKsRol9C7GvJ5Z8SXUljQI5dnaFlHAS7P9ThzH7M3x6csHsP9Clxjpvw92UU2b-ermqlGcTe9bKXspyq_cg1CyGX78jk3m-EVr-ryES6QhRhLyZB9H-6ychrFn30-lrO2joK4HVD8k-cdff6mhfyzmbPUvFfX3BxmQ%3D%3D%22%5D%2Cnull%2C%5B%5B21%2C%22%5B%5B%5B%5B5%2C1%2C%5B0%5D%5D%2C%5B1769491269%2C704339000%5D%2C%5B1209600%5D%5D%5D%5D%22%5D]5D%5D',
-        '_gat_gtag_UA_138692554_2': '1',
-    }
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-        'Sec-Fetch-User': '?1',
-        'Priority': 'u=0, i',
-    }
+FREEPROXY_WORLD_URL = 'https://www.freeproxy.world/'
+FREEPROXY_WORLD_MAX_PAGES = 5  # 爬取第1页到第5页
+FREEPROXY_WORLD_PAGE_WORKERS = 3  # 以有限并发代替逐页延迟
 
-    # 爬取第1页到第5页
-    for page in range(1, 6):
-        params = {
-            'type': '',
-            'anonymity': '',
-            'country': '',
-            'speed': '',
-            'port': '',
-            'page': str(page),
-        }
 
-        try:
-            response = requests.get('https://www.freeproxy.world/',
-                                  params=params,
-                                  cookies=cookies,
-                                  headers=headers,
-                                  timeout=CONFIG["timeout"])
-            response.raise_for_status()
-        except Exception as e:
-            print(f"FreeProxy.World 第 {page} 页请求失败: {e}")
-            continue
+def _freeproxy_world_params(page: int) -> dict:
+    return {
+        'type': '',
+        'anonymity': '',
+        'country': '',
+        'speed': '',
+        'port': '',
+        'page': str(page),
+    }
 
-        soup = BeautifulSoup(response.text, 'html.parser')
 
-        # 找到代理表格
-        table = soup.find('table', class_='table')
-        if not table:
-            print(f"FreeProxy.World 第 {page} 页: 未找到表格")
+def _extract_freeproxy_world_proxies(html: str) -> List[str]:
+    """从freeproxy.world页面表格提取代理"""
+    proxies = []
+    for cols in iter_table_rows(html):
+        # 需要至少6列，且第一列为IP地址（跳过表头和广告行）
+        if len(cols) < 6 or not _is_ipv4(cols[0]):
             continue
 
-        tbody = table.find('tbody')
-        if not tbody:
-            print(f"FreeProxy.World 第 {page} 页: 未找到表格体")
-            continue
+        ip = cols[0]
+        # 端口（可能在<a>标签内，单元格文本即为端口）
+        port = cols[1]
 
-        rows = tbody.find_all('tr')
-        page_proxies = []
-        for row in rows:
-            cols = row.find_all('td')
-            if len(cols) < 6:  # 需要至少6列
-                continue
+        # 提取协议类型（第6列，索引5）；有多个徽章(badge)时取第一个
+        type_text = cols[5].lower()
+        protocol = _detect_protocol(type_text.split()[0] if type_text else '')
 
-            try:
-                # 提取IP地址
-                ip = cols[0].text.strip()
-
-                # 提取端口（可能在<a>标签内）
-                port_elem = cols[1].find('a')
-                port = port_elem.text.strip() if port_elem else cols[1].text.strip()
+        proxies.append(f"{protocol}://{ip}:{port}")
+    return proxies
 
-                # 提取协议类型（第6列，索引5）
-                type_cell = cols[5]
 
-                # 检查是否有徽章(badge)标签
-                badges = type_cell.find_all('a', class_='badge')
-                if badges:
-                    # 取第一个徽章作为协议
-                    protocol = badges[0].text.strip().lower()
-                else:
-                    # 直接提取文本
-                    protocol = type_cell.text.strip().lower()
+def fetch_freeproxy_world_proxies() -> List[str]:
+    """从freeproxy.world获取代理"""
 
-                # 标准化协议字符串
-                if 'socks5' in protocol:
-                    protocol = 'socks5'
-                elif 'socks4' in protocol:
-                    protocol = 'socks4'
-                elif 'socks' in protocol:
-                    protocol = 'socks'  # 通用socks
-                elif 'https' in protocol:
-                    protocol = 'https'
-                else:
-                    protocol = 'http'  # 默认HTTP
+    def _fetch_page(page: int) -> List[str]:
+        try:
+            response = SESSION.get(FREEPROXY_WORLD_URL,
+                                   params=_freeproxy_world_params(page),
+                                   cookies=FREEPROXY_WORLD_COOKIES,
+                                   headers=FREEPROXY_WORLD_HEADERS,
+                                   timeout=CONFIG["timeout"])
+            response.raise_for_status()
+            page_proxies = _extract_freeproxy_world_proxies(response.content.decode('utf-8', errors='replace'))
+            logger.info("FreeProxy.World 第 %s 页: 获取 %s 个代理", page, len(page_proxies))
+            return page_proxies
+        except Exception as e:
+            logger.warning("FreeProxy.World 第 %s 页爬取失败: %s", page, e)
+            return []
+
+    return fetch_pages_concurrently(_fetch_page, range(1, FREEPROXY_WORLD_MAX_PAGES + 1),
+                                    max_workers=FREEPROXY_WORLD_PAGE_WORKERS)
+
+
+PROXYDB_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
+    'Connection': 'keep-alive',
+    'Referer': 'https://proxydb.net/',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'same-origin',
+    'Sec-Fetch-User': '?1',
+    'Priority': 'u=0, i',
+}
 
-                proxy = f"{protocol}://{ip}:{port}"
-                page_proxies.append(proxy)
 
-            except Exception:
-                # 跳过解析错误的行
-                continue
+PROXYDB_URL = 'https://proxydb.net/'
+PROXYDB_OFFSETS = range(0, 151, 30)  # 爬取多个offset页面
+PROXYDB_PAGE_WORKERS = 3  # 同一站点限制为3个并发
+PROXYDB_WINDOW = 200  # 在原始HTML中查找协议关键字时，匹配位置前后的最大字符数
 
-        print(f"FreeProxy.World 第 {page} 页: 获取 {len(page_proxies)} 个代理")
-        proxies.extend(page_proxies)
 
-        # 添加延迟，避免请求过快
-        if page < 5:
-            time.sleep(1)
+def _extract_proxydb_proxies(html: str) -> List[str]:
+    """从proxydb页面提取代理"""
+    proxy_list = []
+    seen = set()
+    html_lower = html.lower()
 
-    return proxies
+    # IP与端口在同一单元格（如 1.2.3.4:8080）：直接在原始HTML上匹配，
+    # 协议关键字只在匹配所在的<tr>行内（至多前后PROXYDB_WINDOW个字符）查找，无需构建DOM
+    for match in LOOSE_IP_PORT_RE.finditer(html):
+        ip, port = match.groups()
+        if f"{ip}:{port}" in seen:
+            continue
+        seen.add(f"{ip}:{port}")
+
+        lo = max(0, match.start() - PROXYDB_WINDOW)
+        hi = match.end() + PROXYDB_WINDOW
+        row_start = html_lower.rfind('<tr', lo, match.start())
+        row_end = html_lower.find('</tr>', match.end(), hi)
+        window = html_lower[lo if row_start == -1 else row_start:hi if row_end == -1 else row_end]
+        # 只在单元格文本中检测协议，链接地址(https://...)、CSS类名等属性值不参与判断
+        window_text = PARTIAL_TAG_RE.sub(' ', HTML_TAG_RE.sub(' ', window))
+
+        protocol = _detect_protocol(window_text)
+        proxy_list.append(f"{protocol}://{ip}:{port}")
+
+    if proxy_list:
+        return proxy_list
+
+    # 页面没有 IP:端口 形式时，IP单独一列，端口为相邻的数字列；同样按正则切分行与单元格，不构建DOM
+    for row in HTML_ROW_RE.finditer(html):
+        cells = [HTML_TAG_RE.sub('', cell).strip() for cell in HTML_CELL_RE.findall(row.group(1))]
+        for idx, text in enumerate(cells):
+            if _is_ipv4(text):
+                if idx + 1 < len(cells) and cells[idx + 1].isdigit():
+                    port = cells[idx + 1]
+                    if f"{text}:{port}" not in seen:
+                        seen.add(f"{text}:{port}")
+                        protocol = _detect_protocol(' '.join(cells).lower())
+                        proxy_list.append(f"{protocol}://{text}:{port}")
+                break
+
+    return proxy_list
 
 
 def fetch_proxydb_proxies() -> List[str]:
     """从proxydb.net获取代理"""
-    proxies = []
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
-        'Connection': 'keep-alive',
-        'Referer': 'https://proxydb.net/',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'same-origin',
-        'Sec-Fetch-User': '?1',
-        'Priority': 'u=0, i',
-    }
-
-    # 辅助函数：从HTML提取代理
-    def extract_proxies_from_html(html):
-        soup = BeautifulSoup(html, 'html.parser')
-        proxy_list = []
-
-        # 方法1: 直接查找IP:Port格式的文本
-        ip_port_pattern = re.compile(r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s*[:：]\s*(\d{2,5})')
-        matches = ip_port_pattern.findall(html)
-        for ip, port in matches:
-            protocol = 'http'  # 默认
-
-            # 查找包含此IP:Port的HTML元素
-            ip_port_text = f"{ip}:{port}"
-            for element in soup.find_all(text=re.compile(re.escape(ip_port_text))):
-                parent_text = element.parent.get_text().lower()
-                if 'socks4' in parent_text:
-                    protocol = 'socks4'
-                elif 'socks5' in parent_text:
-                    protocol = 'socks5'
-                elif 'https' in parent_text:
-                    protocol = 'https'
-                elif 'http' in parent_text:
-                    protocol = 'http'
 
-                proxy_list.append((protocol, ip, port))
-                break  # 找到第一个就跳出
-
-        # 方法2: 查找表格结构
-        table_selectors = [
-            'table',
-            '.table',
-            '.proxy-table',
-            '.proxy-list',
-            'tbody'
-        ]
-
-        for selector in table_selectors:
-            tables = soup.select(selector)
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'div', 'span'])
-                    cell_texts = [cell.get_text(strip=True) for cell in cells]
-                    for text in cell_texts:
-                        ip_matches = re.findall(r'\b(?:\d{1,3}\.){3}\d{1,3}\b', text)
-                        if ip_matches:
-                            ip = ip_matches[0]
-                            port_matches = re.findall(r'\b(\d{2,5})\b', text)
-                            for port in port_matches:
-                                if port != ip.split('.')[-1]:
-                                    protocol = 'http'
-                                    row_text = row.get_text().lower()
-                                    if 'socks4' in row_text:
-                                        protocol = 'socks4'
-                                    elif 'socks5' in row_text:
-                                        protocol = 'socks5'
-                                    elif 'https' in row_text:
-                                        protocol = 'https'
-
-                                    proxy_list.append((protocol, ip, port))
-                                    break
-
-        # 去重
-        unique_proxies = []
-        seen = set()
-        for protocol, ip, port in proxy_list:
-            key = f"{ip}:{port}"
-            if key not in seen:
-                seen.add(key)
-                unique_proxies.append((protocol, ip, port))
-
-        return unique_proxies
-
-    base_url = 'https://proxydb.net/'
-
-    # 爬取多个offset页面
-    for offset in range(0, 151, 30):
+    def _fetch_page(offset: int) -> List[str]:
         params = {'offset': str(offset)}
         try:
-            response = requests.get(base_url, params=params, headers=headers, timeout=CONFIG["timeout"])
+            response = SESSION.get(PROXYDB_URL, params=params, headers=PROXYDB_HEADERS, timeout=CONFIG["timeout"])
             response.raise_for_status()
 
-            extracted = extract_proxies_from_html(response.text)
-            count = 0
-            for protocol, ip, port in extracted:
-                proxies.append(f"{protocol}://{ip}:{port}")
-                count += 1
-
-            print(f"ProxyDB offset={offset}: 获取 {count} 个代理")
+            page_proxies = _extract_proxydb_proxies(response.content.decode('utf-8', errors='replace'))
+            logger.info("ProxyDB offset=%s: 获取 %s 个代理", offset, len(page_proxies))
+            return page_proxies
 
         except Exception as e:
-            print(f"ProxyDB offset={offset} 爬取失败: {e}")
-            continue
+            logger.warning("ProxyDB offset=%s 爬取失败: %s", offset, e)
+            return []
 
-    return proxies
+    return fetch_pages_concurrently(_fetch_page, PROXYDB_OFFSETS, max_workers=PROXYDB_PAGE_WORKERS)
+
+
+# cloudscraper会话：创建开销大（挑战求解、独立Session），整个进程只创建一次
+SCRAPER = None
+
+
+def get_scraper():
+    """返回共享的cloudscraper会话，首次调用时创建（未安装cloudscraper时抛出ImportError）"""
+    global SCRAPER
+    if SCRAPER is None:
+        import cloudscraper
+        SCRAPER = cloudscraper.create_scraper()
+    return SCRAPER
+
+
+# 用户提供的cookies和headers
+PROXY5_COOKIES = {
+    '_ga_2ZGKN4M0P5': 'GS2.1.s1769491268$o1$g0$t1769491268$j60$l0$h0',
+    '_ga': 'GA1.1.1858901822.1769491268',
+    '_gcl_au': '1.1.830845841.1769491268',
+    '_ym_uid': '1769491301957709155',
+    '_ym_d': '1769491301',
+    '_ym_isad': '2',
+    'cf_clearance': 'mcKP.1Sy6F1LN39L6Lt1sHb4Z.uUv4kOh_M3b.ahuQA-1769491300-1.2.1.1-dQwXgN9lzisPgD3wjZeUIGM37gol8xQt58i4gF0wUPSkiY4wu4fGbEIGY_AARwg1GH9TeELFczAG1i7zF0fxSM1EVKyT9WH0pdaUxP3af98183TmD_YoJqvtzN7JqwDGnbBtafqbeuRXnC.9eaEcwR9XFHLIPLOWRWsVsOX1B6DMNn.g9y3Rz7RLlvbZ531uVtAlVNMzhNGbLONJHmcSYCX1rsmnX63Wzz3F5kVg_5A',
+    '_ym_visorc': 'w',
+}
+
+PROXY5_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
+    'Referer': 'https://www.google.com/',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'cross-site',
+    'Sec-Fetch-User': '?1',
+    'Priority': 'u=0, i',
+}
 
 
 def fetch_proxy5_proxies() -> List[str]:
     """从proxy5.net获取代理"""
-    proxies = []
-    # 尝试导入cloudscraper，如果不可用则跳过
+    # 尝试获取cloudscraper，如果不可用则跳过
     try:
-        import cloudscraper
+        scraper = get_scraper()
     except ImportError:
-        print("Proxy5: cloudscraper模块未安装，跳过爬取")
-        return proxies
-
-    # 用户提供的cookies和headers
-    cookies = {
-        '_ga_2ZGKN4M0P5': 'GS2.1.s1769491268$o1$g0$t1769491268$j60$l0$h0',
-        '_ga': 'GA1.1.1858901822.1769491268',
-        '_gcl_au': '1.1.830845841.1769491268',
-        '_ym_uid': '1769491301957709155',
-        '_ym_d': '1769491301',
-        '_ym_isad': '2',
-        'cf_clearance': 'mcKP.1Sy6F1LN39L6Lt1sHb4Z.uUv4kOh_M3b.ahuQA-1769491300-1.2.1.1-dQwXgN9lzisPgD3wjZeUIGM37gol8xQt58i4gF0wUPSkiY4wu4fGbEIGY_AARwg1GH9TeELFczAG1i7zF0fxSM1EVKyT9WH0pdaUxP3af98183TmD_YoJqvtzN7JqwDGnbBtafqbeuRXnC.9eaEcwR9XFHLIPLOWRWsVsOX1B6DMNn.g9y3Rz7RLlvbZ531uVtAlVNMzhNGbLONJHmcSYCX1rsmnX63Wzz3F5kVg_5A',
-        '_ym_visorc': 'w',
-    }
-
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:147.0) Gecko/20100101 Firefox/147.0',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'zh-CN,zh;q=0.9,zh-TW;q=0.8,zh-HK;q=0.7,en-US;q=0.6,en;q=0.5',
-        'Referer': 'https://www.google.com/',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'cross-site',
-        'Sec-Fetch-User': '?1',
-        'Priority': 'u=0, i',
-    }
+        logger.warning("Proxy5: cloudscraper模块未安装，跳过爬取")
+        return []
 
     # 需要爬取的国家/地区列表
     countries = [
@@ -1253,301 +1513,624 @@ def fetch_proxy5_proxies() -> List[str]:
 
     def normalize_protocol(proto):
         """将协议字符串标准化为小写形式"""
-        proto_lower = proto.lower()
-        if 'socks' in proto_lower:
-            # 统一使用 socks5
-            return 'socks5'
-        elif 'https' in proto_lower:
-            return 'https'
-        else:
-            # 默认为 http
-            return 'http'
+        protocol = _detect_protocol(proto.lower())
+        # socks类统一使用 socks5
+        return 'socks5' if protocol.startswith('socks') else protocol
 
-    scraper = cloudscraper.create_scraper()
-
-    for country in countries:
+    def _fetch_country(country: str) -> List[str]:
         url = base_url + country
+        page_proxies = []
         try:
-            response = scraper.get(url, cookies=cookies, headers=headers, timeout=CONFIG["timeout"])
+            response = scraper.get(url, cookies=PROXY5_COOKIES, headers=PROXY5_HEADERS, timeout=CONFIG["timeout"])
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                page_proxies = []
-                # 查找所有包含IP地址的td元素
-                for td in soup.find_all('td'):
-                    strong = td.find('strong')
-                    if strong:
-                        ip = strong.text.strip()
-                        # 简单验证IP地址格式
-                        import re
-                        if re.match(r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}', ip):
-                            # 找到父级tr
-                            tr = td.find_parent('tr')
-                            if tr:
-                                # 获取该行所有td
-                                tds = tr.find_all('td')
-                                if len(tds) >= 4:
-                                    # IP是第一个td
-                                    # 端口是第二个td
-                                    port = tds[1].text.strip()
-                                    # 协议是第三个td
-                                    protocol_raw = tds[2].text.strip()
-                                    protocol = normalize_protocol(protocol_raw)
-                                    page_proxies.append(f"{protocol}://{ip}:{port}")
-                proxies.extend(page_proxies)
-                print(f"Proxy5 {country}: 获取 {len(page_proxies)} 个代理")
+                for tds in iter_table_rows(response.content.decode('utf-8', errors='replace')):
+                    # IP是第一个td，端口是第二个td，协议是第三个td
+                    if len(tds) >= 4 and _is_ipv4(tds[0]):
+                        protocol = normalize_protocol(tds[2])
+                        page_proxies.append(f"{protocol}://{tds[0]}:{tds[1]}")
+                logger.info("Proxy5 %s: 获取 %s 个代理", country, len(page_proxies))
         except Exception as e:
-            print(f"Proxy5 {country} 爬取失败: {e}")
-        # 延迟一下，避免请求过快
-        time.sleep(1)
+            logger.warning("Proxy5 %s 爬取失败: %s", country, e)
+        return page_proxies
 
-    return proxies
+    # 以有限并发代替逐个国家的延迟
+    return fetch_pages_concurrently(_fetch_country, countries, max_workers=3)
+
+
+HOOKZOF_URL = "https://raw.githubusercontent.com/hookzof/socks5_list/master/proxy.txt"
+
+
+def _extract_hookzof_proxies(data: bytes) -> List[str]:
+    """hookzof列表每行一个ip:port，统一按socks5处理"""
+    prefix = PROTOCOL_PREFIX["socks5"]
+    return [prefix + ip.decode('ascii') + ":" + port.decode('ascii')
+            for ip, port in IP_PORT_BYTES_RE.findall(data)]
 
 
 def fetch_hookzof_proxies() -> List[str]:
     """从hookzof/socks5_list GitHub仓库获取SOCKS5代理"""
-    proxies = []
-    url = "https://raw.githubusercontent.com/hookzof/socks5_list/master/proxy.txt"
+    proxies: Set[str] = set()
 
     try:
-        response = requests.get(url, timeout=CONFIG["timeout"])
+        response = SESSION.get(HOOKZOF_URL, timeout=CONFIG["timeout"])
         if response.status_code == 200:
-            lines = response.text.strip().split('\n')
-            count = 0
-            for line in lines:
-                line = line.strip()
-                if line and ':' in line:
-                    # Split IP and port
-                    ip_port = line.split(':', 1)
-                    if len(ip_port) == 2:
-                        ip = ip_port[0].strip()
-                        port = ip_port[1].strip()
-                        if ip and port:
-                            # 移除端口中的非数字字符
-                            import re
-                            port_clean = ''.join(filter(str.isdigit, port))
-                            if port_clean:
-                                proxies.append(f"socks5://{ip}:{port_clean}")
-                                count += 1
-            print(f"Hookzof SOCKS5: 获取 {count} 个代理")
+            found = _extract_hookzof_proxies(response.content)
+            proxies.update(found)
+            logger.info("Hookzof SOCKS5: 获取 %s 个代理", len(found))
     except Exception as e:
-        print(f"Hookzof SOCKS5 爬取失败: {e}")
+        logger.warning("Hookzof SOCKS5 爬取失败: %s", e)
+
+    return list(proxies)
+
+
+# 代理URL列表
+EBRASHA_SOURCES = [
+    ("https://raw.githubusercontent.com/ebrasha/abdal-proxy-hub/refs/heads/main/http-proxy-list-by-EbraSha.txt", "http"),
+    ("https://raw.githubusercontent.com/ebrasha/abdal-proxy-hub/refs/heads/main/https-proxy-list-by-EbraSha.txt", "https"),
+    ("https://raw.githubusercontent.com/ebrasha/abdal-proxy-hub/refs/heads/main/socks4-proxy-list-by-EbraSha.txt", "socks4"),
+    ("https://raw.githubusercontent.com/ebrasha/abdal-proxy-hub/refs/heads/main/socks5-proxy-list-by-EbraSha.txt", "socks5"),
+    ("https://raw.githubusercontent.com/stormsia/proxy-list/refs/heads/main/working_proxies.txt", "http"),  # 默认HTTP
+    ("https://raw.githubusercontent.com/iplocate/free-proxy-list/refs/heads/main/all-proxies.txt", "http"),  # 默认HTTP
+    ("https://raw.githubusercontent.com/vakhov/fresh-proxy-list/refs/heads/master/http.txt", "http"),
+    ("https://github.com/vakhov/fresh-proxy-list/raw/refs/heads/master/https.txt", "https"),
+    ("https://github.com/vakhov/fresh-proxy-list/raw/refs/heads/master/socks4.txt", "socks4"),
+    ("https://github.com/vakhov/fresh-proxy-list/raw/refs/heads/master/socks5.txt", "mixed"),  # 特殊处理，文件中已包含协议
+]
+
 
+def _extract_ebrasha_proxies(lines, protocol: str) -> List[str]:
+    """解析ip:port列表；protocol为mixed时行内已包含协议"""
+    proxies = []
+    prefix = PROTOCOL_PREFIX.get(protocol)
+    for line in lines:
+        if line.startswith('#'):
+            continue
+
+        # 如果协议是mixed，检查是否已包含协议
+        if protocol == "mixed":
+            if LINE_PROXY_URL_RE.match(line):
+                proxies.append(line)
+            # 也可能有未加协议的IP:端口，无法确定协议，跳过
+        else:
+            match = LINE_IP_PORT_RE.match(line)
+            if match:
+                ip, port = match.groups()
+                proxies.append(prefix + ip + ":" + port)
     return proxies
 
 
 def fetch_ebrasha_proxies() -> List[str]:
     """从多个GitHub仓库获取代理（ebrasha, stormsia, iplocate, vakhov）"""
-    proxies = []
-    # 代理URL列表
-    proxy_urls = [
-        ("https://raw.githubusercontent.com/ebrasha/abdal-proxy-hub/refs/heads/main/http-proxy-list-by-EbraSha.txt", "http"),
-        ("https://raw.githubusercontent.com/ebrasha/abdal-proxy-hub/refs/heads/main/https-proxy-list-by-EbraSha.txt", "https"),
-        ("https://raw.githubusercontent.com/ebrasha/abdal-proxy-hub/refs/heads/main/socks4-proxy-list-by-EbraSha.txt", "socks4"),
-        ("https://raw.githubusercontent.com/ebrasha/abdal-proxy-hub/refs/heads/main/socks5-proxy-list-by-EbraSha.txt", "socks5"),
-        ("https://raw.githubusercontent.com/stormsia/proxy-list/refs/heads/main/working_proxies.txt", "http"),  # 默认HTTP
-        ("https://raw.githubusercontent.com/iplocate/free-proxy-list/refs/heads/main/all-proxies.txt", "http"),  # 默认HTTP
-        ("https://raw.githubusercontent.com/vakhov/fresh-proxy-list/refs/heads/master/http.txt", "http"),
-        ("https://github.com/vakhov/fresh-proxy-list/raw/refs/heads/master/https.txt", "https"),
-        ("https://github.com/vakhov/fresh-proxy-list/raw/refs/heads/master/socks4.txt", "socks4"),
-        ("https://github.com/vakhov/fresh-proxy-list/raw/refs/heads/master/socks5.txt", "mixed"),  # 特殊处理，文件中已包含协议
+
+    def _fetch_list(item) -> List[str]:
+        url, protocol = item
+        list_proxies = []
+        try:
+            with SESSION.get(url, timeout=CONFIG["timeout"], stream=True) as response:
+                if response.status_code == 200:
+                    list_proxies = _extract_ebrasha_proxies(iter_response_lines(response), protocol)
+                    logger.info("Ebrasha %s: 获取 %s 个代理", url.split('/')[3], len(list_proxies))
+        except Exception as e:
+            logger.warning("Ebrasha %s 爬取失败: %s", url, e)
+        return list_proxies
+
+    return fetch_pages_concurrently(_fetch_list, EBRASHA_SOURCES)
+
+
+async def afetch_bytes(session, url: str, **kwargs) -> bytes:
+    """异步GET请求，非200状态抛出异常，返回原始响应体"""
+    async with session.get(url, **kwargs) as response:
+        response.raise_for_status()
+        return await response.read()
+
+async def afetch_text(session, url: str, **kwargs) -> str:
+    """异步GET请求并按UTF-8解码响应体"""
+    body = await afetch_bytes(session, url, **kwargs)
+    return body.decode('utf-8', errors='replace')
+
+async def afetch_pages_concurrently(fetch_page, pages, max_workers: Optional[int] = None) -> List[str]:
+    """异步并发抓取同一源的多个分页，合并并去重结果"""
+    semaphore = asyncio.Semaphore(max_workers or CONFIG["page_workers"])
+
+    async def _bounded(page):
+        async with semaphore:
+            return await fetch_page(page)
+
+    proxies: Set[str] = set()
+    for page_proxies in await asyncio.gather(*(_bounded(page) for page in pages)):
+        proxies.update(page_proxies)
+    return list(proxies)
+
+async def afetch_geonode_proxies(session) -> List[str]:
+    """异步从Geonode获取代理（多页）"""
+
+    async def _fetch_page(page: int) -> List[str]:
+        try:
+            body = await afetch_bytes(session, GEONODE_URL.format(page=page))
+            page_proxies = _extract_geonode_proxies(json_loads(body))
+            logger.info("Geonode 第 %s 页: 获取 %s 个代理", page, len(page_proxies))
+            return page_proxies
+        except Exception as e:
+            logger.warning("Geonode 第 %s 页爬取失败: %s", page, e)
+            return []
+
+    # 第1页没有数据（或请求失败）时不再翻页；否则并发抓取其余分页
+    first_page = await _fetch_page(1)
+    if not first_page:
+        return []
+    proxies: Set[str] = set(first_page)
+    proxies.update(await afetch_pages_concurrently(_fetch_page, range(2, GEONODE_MAX_PAGES + 1)))
+    return list(proxies)
+
+async def afetch_free_proxy_list(session) -> List[str]:
+    """异步从free-proxy-list.net获取代理"""
+    try:
+        return _extract_free_proxy_list_proxies(await afetch_bytes(session, FREE_PROXY_LIST_URL))
+    except Exception as e:
+        logger.warning("Free Proxy List爬取失败: %s", e)
+        return []
+
+async def afetch_proxyscrape_proxies(session) -> List[str]:
+    """异步从ProxyScrape获取代理"""
+
+    async def _fetch_protocol(protocol: str) -> List[str]:
+        try:
+            text = await afetch_text(session, PROXYSCRAPE_URL.format(protocol=protocol))
+            found = _extract_proxyscrape_proxies(iter_clean_lines(text.splitlines()), protocol)
+            logger.info("ProxyScrape %s: 获取 %s 个代理", protocol, len(found))
+            return found
+        except Exception as e:
+            logger.warning("ProxyScrape %s 爬取失败: %s", protocol, e)
+            return []
+
+    return await afetch_pages_concurrently(_fetch_protocol, PROXYSCRAPE_PROTOCOLS)
+
+async def afetch_roosterkid_proxies(session) -> List[str]:
+    """异步从RoosterKid的GitHub仓库获取代理"""
+
+    async def _fetch_source(source) -> List[str]:
+        url, protocol = source
+        try:
+            text = await afetch_text(session, url)
+            lines = iter_clean_lines(text.splitlines(), skip=ROOSTERKID_HEADER_LINES)
+            found = _extract_roosterkid_proxies(lines, protocol)
+            logger.info("RoosterKid %s: 获取 %s 个代理", protocol, len(found))
+            return found
+        except Exception as e:
+            logger.warning("RoosterKid %s 爬取失败: %s", protocol, e)
+            return []
+
+    return await afetch_pages_concurrently(_fetch_source, ROOSTERKID_SOURCES)
+
+async def afetch_proxifly_proxies(session) -> List[str]:
+    """异步从proxifly/free-proxy-list获取代理"""
+    try:
+        text = await afetch_text(session, PROXIFLY_URL)
+        found = _extract_proxifly_proxies(iter_clean_lines(text.splitlines()))
+        logger.info("Proxifly Free Proxy List: 获取 %s 个代理", len(found))
+        return found
+    except Exception as e:
+        logger.warning("Proxifly Free Proxy List爬取失败: %s", e)
+        return []
+
+async def afetch_sockslist_us_proxies(session) -> List[str]:
+    """异步从sockslist.us获取代理"""
+    try:
+        text = await afetch_text(session, SOCKSLIST_US_URL)
+        found = _extract_sockslist_us_proxies(iter_clean_lines(text.splitlines()))
+        logger.info("SocksList US: 获取 %s 个代理", len(found))
+        return found
+    except Exception as e:
+        logger.warning("SocksList US爬取失败: %s", e)
+        return []
+
+async def afetch_zdaye_proxies(session) -> List[str]:
+    """异步从zdaye.com获取代理"""
+
+    async def _fetch_page(page: int) -> List[str]:
+        try:
+            html = await afetch_text(session, ZDAYE_URL.format(page=page), headers=ZDAYE_HEADERS)
+            page_proxies = _extract_zdaye_proxies(html)
+            if page_proxies is None:
+                logger.warning("Zdaye 第 %s 页: 未找到表格", page)
+                return []
+            logger.info("Zdaye 第 %s 页: 获取 %s 个代理", page, len(page_proxies))
+            return page_proxies
+        except Exception as e:
+            logger.warning("Zdaye 第 %s 页爬取失败: %s", page, e)
+            return []
+
+    return await afetch_pages_concurrently(_fetch_page, range(1, ZDAYE_MAX_PAGES + 1))
+
+async def afetch_89ip_proxies(session) -> List[str]:
+    """异步从89ip.cn获取代理"""
+
+    async def _fetch_page(page: int) -> List[str]:
+        try:
+            html = await afetch_text(session, IP89_URL.format(page=page), cookies=IP89_COOKIES, headers=IP89_HEADERS)
+            page_proxies = _extract_89ip_proxies(html)
+            logger.info("89ip 第 %s 页: 获取 %s 个代理", page, len(page_proxies))
+            return page_proxies
+        except Exception as e:
+            logger.warning("89ip 第 %s 页爬取失败: %s", page, e)
+            return []
+
+    return await afetch_pages_concurrently(_fetch_page, range(1, IP89_MAX_PAGES + 1))
+
+async def afetch_ip3366_proxies(session) -> List[str]:
+    """异步从ip3366.net获取代理"""
+
+    async def _fetch_page(page: int) -> List[str]:
+        params = {
+            'stype': '1',
+            'page': str(page),
+        }
+        try:
+            html = await afetch_text(session, IP3366_URL, params=params, cookies=IP3366_COOKIES, headers=IP3366_HEADERS)
+            page_proxies = _extract_ip3366_proxies(html)
+            logger.info("ip3366 第 %s 页: 获取 %s 个代理", page, len(page_proxies))
+            return page_proxies
+        except Exception as e:
+            logger.warning("ip3366 第 %s 页爬取失败: %s", page, e)
+            return []
+
+    return await afetch_pages_concurrently(_fetch_page, range(1, IP3366_MAX_PAGES + 1), max_workers=IP3366_PAGE_WORKERS)
+
+async def afetch_kuaidaili_proxies(session) -> List[str]:
+    """异步从kuaidaili.com获取代理"""
+
+    async def _fetch_page(page_spec) -> List[str]:
+        base_url, page = page_spec
+        try:
+            html = await afetch_text(session, f"{base_url}{page}", cookies=KUAIDAILI_COOKIES, headers=KUAIDAILI_HEADERS)
+            page_proxies = _extract_kuaidaili_proxies(html)
+            logger.info("kuaidaili %s 第 %s 页: 获取 %s 个代理", base_url, page, len(page_proxies))
+            return page_proxies
+        except Exception as e:
+            logger.warning("kuaidaili %s 第 %s 页爬取失败: %s", base_url, page, e)
+            return []
+
+    return await afetch_pages_concurrently(_fetch_page, KUAIDAILI_PAGE_SPECS, max_workers=KUAIDAILI_PAGE_WORKERS)
+
+async def afetch_proxylistplus_proxies(session) -> List[str]:
+    """异步从proxylistplus.com获取代理"""
+
+    async def _fetch_list(spec) -> List[str]:
+        name, url, cookies, default_protocol = spec
+        try:
+            html = await afetch_text(session, url, cookies=cookies, headers=PROXYLISTPLUS_HEADERS)
+            # BeautifulSoup解析是纯CPU工作，放到线程中避免阻塞事件循环
+            found = await asyncio.to_thread(_extract_proxylistplus_proxies, html, default_protocol)
+            logger.info("proxylistplus %s: 获取 %s 个代理", name, len(found))
+            return found
+        except Exception as e:
+            logger.warning("proxylistplus %s爬取失败: %s", name, e)
+            return []
+
+    specs = [
+        ("Socks", PROXYLISTPLUS_SOCKS_URL, PROXYLISTPLUS_SOCKS_COOKIES, "socks"),
+        ("HTTP", PROXYLISTPLUS_HTTP_URL, PROXYLISTPLUS_HTTP_COOKIES, "http"),
     ]
+    return await afetch_pages_concurrently(_fetch_list, specs)
+
+async def afetch_uu_proxy_proxies(session) -> List[str]:
+    """异步从uu-proxy.com获取代理"""
+    try:
+        data = json_loads(await afetch_bytes(session, UU_PROXY_URL, headers=UU_PROXY_HEADERS))
+        found = _extract_uu_proxy_proxies(data)
+        if found is None:
+            logger.warning("uu-proxy API返回不成功或数据缺失: %s", data)
+            return []
+        logger.info("uu-proxy: 获取 %s 个代理", len(found))
+        return found
+    except Exception as e:
+        logger.warning("uu-proxy爬取失败: %s", e)
+        return []
 
-    import re
-    ip_port_pattern = re.compile(r'^(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}):(\d+)$')
-    protocol_pattern = re.compile(r'^(socks[45]|http|https)://\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d+$')
+async def afetch_free_proxy_list_github(session) -> List[str]:
+    """异步从databay-labs/free-proxy-list GitHub仓库获取代理"""
 
-    for url, protocol in proxy_urls:
+    async def _fetch_list(item) -> List[str]:
+        protocol, url = item
         try:
-            response = requests.get(url, timeout=CONFIG["timeout"])
-            if response.status_code == 200:
-                content = response.text
-                lines = content.splitlines()
-                count = 0
-                for line in lines:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-
-                    # 如果协议是mixed，检查是否已包含协议
-                    if protocol == "mixed":
-                        if protocol_pattern.match(line):
-                            proxies.append(line)
-                            count += 1
-                        # 也可能有未加协议的IP:端口
-                        elif ip_port_pattern.match(line):
-                            # 无法确定协议，跳过
-                            pass
-                    else:
-                        match = ip_port_pattern.match(line)
-                        if match:
-                            ip, port = match.groups()
-                            proxies.append(f"{protocol}://{ip}:{port}")
-                            count += 1
-                print(f"Ebrasha {url.split('/')[3]}: 获取 {count} 个代理")
+            found = _extract_free_proxy_list_github_proxies(await afetch_bytes(session, url), protocol)
+            logger.info("Free Proxy List GitHub %s: 获取 %s 个代理", protocol, len(found))
+            return found
         except Exception as e:
-            print(f"Ebrasha {url} 爬取失败: {e}")
+            logger.warning("Free Proxy List GitHub %s 爬取失败: %s", protocol, e)
+            return []
 
-    return proxies
+    return await afetch_pages_concurrently(_fetch_list, FREE_PROXY_LIST_GITHUB_URLS.items())
+
+async def afetch_nodemaven_proxies(session) -> List[str]:
+    """异步从nodemaven.com获取代理"""
+
+    async def _fetch_page(page: int) -> List[str]:
+        params = {**NODEMAVEN_PARAMS, 'page': str(page)}
+        try:
+            body = await afetch_bytes(session, NODEMAVEN_URL, params=params,
+                                      cookies=NODEMAVEN_COOKIES, headers=NODEMAVEN_HEADERS)
+            page_proxies = _extract_nodemaven_proxies(json_loads(body))
+            logger.info("Nodemaven 第 %s 页: 获取 %s 个代理", page, len(page_proxies))
+            return page_proxies
+        except Exception as e:
+            logger.warning("Nodemaven 第 %s 页爬取失败: %s", page, e)
+            return []
+
+    return await afetch_pages_concurrently(_fetch_page, range(1, NODEMAVEN_MAX_PAGES + 1),
+                                           max_workers=NODEMAVEN_PAGE_WORKERS)
+
+async def afetch_freeproxy_world_proxies(session) -> List[str]:
+    """异步从freeproxy.world获取代理"""
+
+    async def _fetch_page(page: int) -> List[str]:
+        try:
+            html = await afetch_text(session, FREEPROXY_WORLD_URL, params=_freeproxy_world_params(page),
+                                     cookies=FREEPROXY_WORLD_COOKIES, headers=FREEPROXY_WORLD_HEADERS)
+            page_proxies = await asyncio.to_thread(_extract_freeproxy_world_proxies, html)
+            logger.info("FreeProxy.World 第 %s 页: 获取 %s 个代理", page, len(page_proxies))
+            return page_proxies
+        except Exception as e:
+            logger.warning("FreeProxy.World 第 %s 页爬取失败: %s", page, e)
+            return []
+
+    return await afetch_pages_concurrently(_fetch_page, range(1, FREEPROXY_WORLD_MAX_PAGES + 1),
+                                           max_workers=FREEPROXY_WORLD_PAGE_WORKERS)
 
+async def afetch_proxydb_proxies(session) -> List[str]:
+    """异步从proxydb.net获取代理"""
+
+    async def _fetch_page(offset: int) -> List[str]:
+        try:
+            html = await afetch_text(session, PROXYDB_URL, params={'offset': str(offset)}, headers=PROXYDB_HEADERS)
+            page_proxies = await asyncio.to_thread(_extract_proxydb_proxies, html)
+            logger.info("ProxyDB offset=%s: 获取 %s 个代理", offset, len(page_proxies))
+            return page_proxies
+        except Exception as e:
+            logger.warning("ProxyDB offset=%s 爬取失败: %s", offset, e)
+            return []
+
+    return await afetch_pages_concurrently(_fetch_page, PROXYDB_OFFSETS, max_workers=PROXYDB_PAGE_WORKERS)
+
+async def afetch_hookzof_proxies(session) -> List[str]:
+    """异步从hookzof/socks5_list GitHub仓库获取SOCKS5代理"""
+    try:
+        found = _extract_hookzof_proxies(await afetch_bytes(session, HOOKZOF_URL))
+        logger.info("Hookzof SOCKS5: 获取 %s 个代理", len(found))
+        return found
+    except Exception as e:
+        logger.warning("Hookzof SOCKS5 爬取失败: %s", e)
+        return []
+
+async def afetch_ebrasha_proxies(session) -> List[str]:
+    """异步从多个GitHub仓库获取代理（ebrasha, stormsia, iplocate, vakhov）"""
+
+    async def _fetch_list(item) -> List[str]:
+        url, protocol = item
+        try:
+            text = await afetch_text(session, url)
+            found = _extract_ebrasha_proxies(iter_clean_lines(text.splitlines()), protocol)
+            logger.info("Ebrasha %s: 获取 %s 个代理", url.split('/')[3], len(found))
+            return found
+        except Exception as e:
+            logger.warning("Ebrasha %s 爬取失败: %s", url, e)
+            return []
+
+    return await afetch_pages_concurrently(_fetch_list, EBRASHA_SOURCES)
+
+
+# 所有代理源（各源相互独立，由crawl_proxies并发执行）
+FETCHERS = [
+    fetch_geonode_proxies,
+    fetch_free_proxy_list,
+    fetch_proxyscrape_proxies,
+    fetch_roosterkid_proxies,
+    fetch_proxifly_proxies,
+    fetch_sockslist_us_proxies,
+    fetch_zdaye_proxies,
+    fetch_spys_one_proxies,
+    fetch_89ip_proxies,
+    fetch_ip3366_proxies,
+    fetch_kuaidaili_proxies,
+    fetch_proxylistplus_proxies,
+    fetch_uu_proxy_proxies,
+    fetch_free_proxy_list_github,
+    fetch_nodemaven_proxies,
+    fetch_freeproxy_world_proxies,
+    fetch_proxydb_proxies,
+    fetch_proxy5_proxies,
+    fetch_hookzof_proxies,
+    fetch_ebrasha_proxies,
+]
+
+# 原生异步实现的源；其余源（spys.one的POST会话、proxy5的cloudscraper）在异步模式下放到线程池中运行
+ASYNC_FETCHERS = {
+    fetch_geonode_proxies: afetch_geonode_proxies,
+    fetch_free_proxy_list: afetch_free_proxy_list,
+    fetch_proxyscrape_proxies: afetch_proxyscrape_proxies,
+    fetch_roosterkid_proxies: afetch_roosterkid_proxies,
+    fetch_proxifly_proxies: afetch_proxifly_proxies,
+    fetch_sockslist_us_proxies: afetch_sockslist_us_proxies,
+    fetch_zdaye_proxies: afetch_zdaye_proxies,
+    fetch_89ip_proxies: afetch_89ip_proxies,
+    fetch_ip3366_proxies: afetch_ip3366_proxies,
+    fetch_kuaidaili_proxies: afetch_kuaidaili_proxies,
+    fetch_proxylistplus_proxies: afetch_proxylistplus_proxies,
+    fetch_uu_proxy_proxies: afetch_uu_proxy_proxies,
+    fetch_free_proxy_list_github: afetch_free_proxy_list_github,
+    fetch_nodemaven_proxies: afetch_nodemaven_proxies,
+    fetch_freeproxy_world_proxies: afetch_freeproxy_world_proxies,
+    fetch_proxydb_proxies: afetch_proxydb_proxies,
+    fetch_hookzof_proxies: afetch_hookzof_proxies,
+    fetch_ebrasha_proxies: afetch_ebrasha_proxies,
+}
+
+
+async def crawl_proxies_async() -> List[str]:
+    """异步爬取所有代理源 - 共享ClientSession，所有源在同一事件循环中并发"""
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError("aiohttp 未安装，请运行: pip install -r simple_requirements.txt")
+
+    logger.info("开始异步爬取代理...")
+
+    loop = asyncio.get_running_loop()
+    # 与requests的timeout语义一致：限制连接与单次读取时间，而非整个下载
+    timeout = aiohttp.ClientTimeout(sock_connect=CONFIG["timeout"], sock_read=CONFIG["timeout"])
+    # 同一主机（如raw.githubusercontent.com）的多个请求复用keep-alive连接与DNS解析结果
+    connector = aiohttp.TCPConnector(limit=CONFIG["async_crawler_concurrency"],
+                                     limit_per_host=CONFIG["async_crawler_per_host"],
+                                     ttl_dns_cache=600,
+                                     keepalive_timeout=30)
+
+    executor = get_crawl_pool()
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        tasks = [
+            ASYNC_FETCHERS[fetcher](session) if fetcher in ASYNC_FETCHERS
+            else loop.run_in_executor(executor, fetcher)
+            for fetcher in FETCHERS
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    all_proxies: Set[str] = set()
+    for fetcher, result in zip(FETCHERS, results):
+        if isinstance(result, Exception):
+            logger.warning("%s 爬取失败: %s", fetcher.__name__, result)
+        else:
+            all_proxies.update(result)
+
+    logger.info("爬取完成，获取 %s 个唯一代理", len(all_proxies))
+    return list(all_proxies)
 
 def crawl_proxies() -> List[str]:
-    """爬取所有代理源"""
-    print("开始爬取代理...")
-
-    all_proxies = []
-
-    # 从多个源爬取
-    sources = [
-        fetch_geonode_proxies,
-        fetch_free_proxy_list,
-        fetch_proxyscrape_proxies,
-        fetch_roosterkid_proxies,
-        fetch_proxifly_proxies,
-        fetch_sockslist_us_proxies,
-        fetch_zdaye_proxies,
-        fetch_spys_one_proxies,
-        fetch_89ip_proxies,
-        fetch_ip3366_proxies,
-        fetch_kuaidaili_proxies,
-        fetch_proxylistplus_proxies,
-        fetch_uu_proxy_proxies,
-        fetch_free_proxy_list_github,
-        fetch_nodemaven_proxies,
-        fetch_freeproxy_world_proxies,
-        fetch_proxydb_proxies,
-        fetch_proxy5_proxies,
-        fetch_hookzof_proxies,
-        fetch_ebrasha_proxies,
-    ]
+    """爬取所有代理源，根据配置选择异步或同步爬取"""
+    if CONFIG["crawler_mode"] == "async":
+        try:
+            return run_async(crawl_proxies_async())
+        except ImportError as e:
+            logger.warning("[警告] 异步爬取依赖未安装，回退到同步爬取: %s", e)
+            CONFIG["crawler_mode"] = "sync"
+        except Exception as e:
+            logger.warning("[警告] 异步爬取失败，回退到同步爬取: %s", e)
+            CONFIG["crawler_mode"] = "sync"
 
-    with ThreadPoolExecutor(max_workers=CONFIG["crawler_workers"]) as executor:
-        futures = [executor.submit(source) for source in sources]
+    logger.info("开始爬取代理...")
 
-        for future in as_completed(futures):
-            try:
-                proxies = future.result()
-                all_proxies.extend(proxies)
-            except Exception as e:
-                print(f"爬取失败: {e}")
+    all_proxies: Set[str] = set()
 
-    # 去重
-    unique_proxies = list(set(all_proxies))
-    print(f"爬取完成，获取 {len(unique_proxies)} 个唯一代理")
+    executor = get_crawl_pool()
+    futures = {executor.submit(fetcher): fetcher.__name__ for fetcher in FETCHERS}
 
-    return unique_proxies
+    for future in as_completed(futures):
+        try:
+            all_proxies.update(future.result())
+        except Exception as e:
+            logger.warning("%s 爬取失败: %s", futures[future], e)
+
+    logger.info("爬取完成，获取 %s 个唯一代理", len(all_proxies))
+
+    return list(all_proxies)
+
+# 异步验证每完成多少个测试重新评估一次并发上限
+VALIDATOR_ADAPT_WINDOW = 500
+
+# 验证进度日志的最小间隔（秒）：检查点按完成数量写入，进度日志在每次完成时按时间节流
+PROGRESS_LOG_SECONDS = 1.0
+
+def _progress_interval(total: int) -> int:
+    """根据总数动态调整进度更新（写入检查点）的频率"""
+    if total > 10000:
+        return 500  # 大量代理时每500个更新一次
+    elif total > 1000:
+        return 100   # 中等数量代理每100个更新一次
+    return 50    # 少量代理每50个更新一次
 
 def test_proxy(proxy: str) -> Tuple[bool, Optional[float]]:
-    """测试单个代理是否可用"""
+    """测试单个代理是否可用
+
+    每个代理只测试一次，经不同代理的连接无法复用，因此每次测试使用独立会话，
+    测试结束即关闭其连接池（不经过SESSION的重试）。
+    """
     try:
         proxies = {
             "http": proxy,
             "https": proxy
         }
 
-        start_time = time.time()
-        response = requests.get(
-            CONFIG["test_url"],
-            proxies=proxies,
-            timeout=CONFIG["timeout"]
-        )
-        end_time = time.time()
+        with requests.Session() as session:
+            start_time = time.perf_counter()
+            # 返回200即认为可用：只接收响应头，不下载、不解析响应体
+            with session.get(
+                CONFIG["test_url"],
+                proxies=proxies,
+                timeout=(CONFIG["connect_timeout"], CONFIG["timeout"]),
+                stream=True,
+                allow_redirects=False
+            ) as response:
+                return response.status_code == 200, time.perf_counter() - start_time
+
+    # 只捕获代理失效时的预期错误（超时、连接错误、无效的代理地址）
+    except (requests.RequestException, OSError, ValueError):
+        return False, None
 
-        response_time = end_time - start_time
+async def test_proxy_async(session, proxy: str) -> Tuple[bool, Optional[float]]:
+    """异步测试单个代理是否可用
 
-        if response.status_code == 200:
-            # 检查返回的IP是否与代理IP匹配
-            try:
-                data = response.json()
-                if "origin" in data:
-                    # 简单的验证：确保返回了数据
-                    return True, response_time
-            except:
-                # 即使不是JSON格式，只要返回200也认为是成功的
-                return True, response_time
+    HTTP/HTTPS代理复用传入的共享session；SOCKS代理需要专用连接器，单独建立session。
+    """
+    import aiohttp
+    from aiohttp_socks import ProxyConnector, ProxyError, ProxyConnectionError, ProxyTimeoutError
 
-        return False, response_time
+    try:
+        start_time = asyncio.get_running_loop().time()
 
-    except Exception:
+        # 根据代理协议类型选择不同的连接方式
+        if proxy.startswith(('socks5://', 'socks5h://', 'socks4://')):
+            # SOCKS代理，使用aiohttp_socks（socks5h表示由代理端解析域名）
+            if proxy.startswith('socks5h://'):
+                connector = ProxyConnector.from_url('socks5://' + proxy[len('socks5h://'):], rdns=True)
+            else:
+                connector = ProxyConnector.from_url(proxy)
+            timeout = aiohttp.ClientTimeout(total=CONFIG["timeout"], sock_connect=CONFIG["connect_timeout"])
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as socks_session:
+                async with socks_session.get(CONFIG["test_url"]) as response:
+                    return _check_test_response(response, start_time)
+        else:
+            # HTTP/HTTPS代理，使用aiohttp内置代理支持
+            # 确保代理URL有协议头
+            if not proxy.startswith('http://') and not proxy.startswith('https://'):
+                proxy_url = f"http://{proxy}"
+            else:
+                proxy_url = proxy
+
+            async with session.get(CONFIG["test_url"], proxy=proxy_url) as response:
+                return _check_test_response(response, start_time)
+
+    # 只捕获代理失效时的预期错误（超时、连接/协议错误、无效的代理地址），其他异常交由调用方记录
+    except (asyncio.TimeoutError, aiohttp.ClientError, OSError, ValueError,
+            ProxyError, ProxyConnectionError, ProxyTimeoutError):
         return False, None
 
-async def test_proxy_async(proxy: str, semaphore: asyncio.Semaphore) -> Tuple[bool, Optional[float]]:
-    """异步测试单个代理是否可用"""
+def _check_test_response(response, start_time: float) -> Tuple[bool, Optional[float]]:
+    """根据测试请求的响应判断代理是否可用：返回200即可用，不读取响应体"""
+    return response.status == 200, asyncio.get_running_loop().time() - start_time
+
+async def validate_proxies_async(proxies: List[str]) -> List[str]:
+    """异步验证代理可用性 - 共享ClientSession，worker从队列中取代理测试
+
+    同时进行的测试数上限随最近一批测试的失败率自适应调整：
+    大部分超时/连接失败时减半，失败很少时加倍（介于初始并发数与上限之间）。
+    """
     # 动态导入异步依赖
     try:
         import aiohttp
-        from aiohttp_socks import ProxyConnector
+        import aiohttp_socks  # noqa: F401
     except ImportError:
         # 如果异步依赖未安装，抛出异常让外层处理
         raise ImportError("aiohttp 或 aiohttp_socks 未安装，请运行: pip install -r simple_requirements.txt")
 
-    async with semaphore:
-        try:
-            start_time = time.time()
-
-            # 设置超时
-            timeout = aiohttp.ClientTimeout(total=CONFIG["timeout"])
-
-            # 根据代理协议类型选择不同的连接方式
-            if proxy.startswith('socks5://') or proxy.startswith('socks4://'):
-                # SOCKS代理，使用aiohttp_socks
-                try:
-                    connector = ProxyConnector.from_url(proxy)
-                    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-                        async with session.get(CONFIG["test_url"]) as response:
-                            end_time = time.time()
-                            response_time = end_time - start_time
-
-                            if response.status == 200:
-                                # 检查返回的IP是否与代理IP匹配
-                                try:
-                                    data = await response.json()
-                                    if "origin" in data:
-                                        return True, response_time
-                                except:
-                                    # 即使不是JSON格式，只要返回200也认为是成功的
-                                    return True, response_time
-
-                            return False, response_time
-                except asyncio.TimeoutError:
-                    return False, None
-                except Exception:
-                    return False, None
-            else:
-                # HTTP/HTTPS代理，使用aiohttp内置代理支持
-                # 确保代理URL有协议头
-                if not proxy.startswith('http://') and not proxy.startswith('https://'):
-                    proxy_url = f"http://{proxy}"
-                else:
-                    proxy_url = proxy
-
-                try:
-                    async with aiohttp.ClientSession(timeout=timeout) as session:
-                        async with session.get(CONFIG["test_url"], proxy=proxy_url) as response:
-                            end_time = time.time()
-                            response_time = end_time - start_time
-
-                            if response.status == 200:
-                                # 检查返回的IP是否与代理IP匹配
-                                try:
-                                    data = await response.json()
-                                    if "origin" in data:
-                                        return True, response_time
-                                except:
-                                    # 即使不是JSON格式，只要返回200也认为是成功的
-                                    return True, response_time
-
-                            return False, response_time
-                except asyncio.TimeoutError:
-                    return False, None
-                except Exception:
-                    return False, None
-
-        except Exception:
-            return False, None
-
-async def validate_proxies_async(proxies: List[str]) -> List[str]:
-    """异步验证代理可用性 - 使用任务队列控制并发"""
-    print(f"开始异步验证 {len(proxies)} 个代理...")
+    logger.info("开始异步验证 %s 个代理...", len(proxies))
 
     valid_proxies = []
     total = len(proxies)
@@ -1555,101 +2138,89 @@ async def validate_proxies_async(proxies: List[str]) -> List[str]:
     if total == 0:
         return []
 
-    # 创建信号量限制并发数
-    semaphore = asyncio.Semaphore(CONFIG["async_validator_concurrency"])
+    min_concurrency = CONFIG["async_validator_concurrency"]
+    max_concurrency = max(min_concurrency, CONFIG["async_validator_max_concurrency"])
 
-    # 使用集合来跟踪运行中的任务
-    pending_tasks = {}
-    completed_count = 0
-    next_proxy_index = 0
-
-    # 初始填充任务，不超过并发限制
-    while next_proxy_index < total and len(pending_tasks) < CONFIG["async_validator_concurrency"]:
-        proxy = proxies[next_proxy_index]
-        task = asyncio.create_task(test_proxy_async(proxy, semaphore))
-        pending_tasks[task] = proxy
-        next_proxy_index += 1
-
-    try:
-        while pending_tasks:
-            # 等待至少一个任务完成
-            done, pending = await asyncio.wait(
-                set(pending_tasks.keys()),  # 转换为集合
-                return_when=asyncio.FIRST_COMPLETED,
-                timeout=CONFIG["timeout"] * 2  # 超时时间稍长一些
-            )
-
-            # 处理超时情况（没有任务完成）
-            if not done:
-                # 检查是否有任务卡住，取消所有任务并重新开始
-                print(f"[警告] 等待任务完成超时，取消 {len(pending_tasks)} 个任务")
-                # 将取消的任务计入完成数量
-                cancelled_tasks = list(pending_tasks.keys())
-                for task in cancelled_tasks:
-                    task.cancel()
-                # 等待取消完成
-                await asyncio.gather(*cancelled_tasks, return_exceptions=True)
-                # 更新完成计数
-                completed_count += len(cancelled_tasks)
-                # 清空pending_tasks，重新开始
-                pending_tasks.clear()
-                # 重新添加任务，从当前索引开始
-                while next_proxy_index < total and len(pending_tasks) < CONFIG["async_validator_concurrency"]:
-                    proxy = proxies[next_proxy_index]
-                    task = asyncio.create_task(test_proxy_async(proxy, semaphore))
-                    pending_tasks[task] = proxy
-                    next_proxy_index += 1
-                continue
-
-            # 处理完成的任务
-            for task in done:
-                proxy = pending_tasks.pop(task, None)
-                if proxy is None:
-                    # 任务可能已经被移除了
-                    continue
+    # 待测代理放入队列，由固定数量的worker依次取出，不为每个代理预先创建任务
+    pending: asyncio.Queue = asyncio.Queue()
+    for proxy in proxies:
+        pending.put_nowait(proxy)
 
+    update_interval = _progress_interval(total)
+    completed_count = 0
+    checkpointed = 0  # 已写入检查点的有效代理数
+    last_report = time.monotonic()
+
+    # 自适应并发：active为正在进行的测试数，cap为当前允许的上限
+    gate = asyncio.Condition()
+    active = 0
+    cap = min_concurrency
+    window_done = 0
+    window_failed = 0  # 本轮中超时或连接失败（无响应时间）的测试数
+
+    def _adjust_cap():
+        """每完成VALIDATOR_ADAPT_WINDOW个测试，按失败率调整并发上限（需持有gate）"""
+        nonlocal cap, window_done, window_failed
+        if window_done < VALIDATOR_ADAPT_WINDOW:
+            return
+        fail_rate = window_failed / window_done
+        window_done = window_failed = 0
+        if fail_rate > 0.7:
+            cap = max(min_concurrency, cap // 2)
+        elif fail_rate < 0.2 and cap < max_concurrency:
+            cap = min(max_concurrency, cap * 2)
+            gate.notify_all()
+
+    async def _validate_one(session, proxy: str):
+        nonlocal completed_count, checkpointed, window_done, window_failed, last_report
+        try:
+            is_valid, response_time = await test_proxy_async(session, proxy)
+            window_done += 1
+            if response_time is None:
+                window_failed += 1
+            if is_valid and response_time and response_time <= CONFIG["max_response_time"]:
+                valid_proxies.append(proxy)
+        finally:
+            completed_count += 1
+            if completed_count % update_interval == 0 or completed_count == total:
+                append_proxies(valid_proxies[checkpointed:])
+                checkpointed = len(valid_proxies)
+            now = time.monotonic()
+            if completed_count == total or now - last_report >= PROGRESS_LOG_SECONDS:
+                last_report = now
+                percent = (completed_count / total) * 100
+                logger.info("进度: %s/%s (%.1f%%)，有效: %s", completed_count, total, percent, len(valid_proxies))
+
+    async def _worker(session):
+        nonlocal active
+        while not pending.empty():
+            async with gate:
+                await gate.wait_for(lambda: active < cap)
+                active += 1
+            try:
+                # 等待期间队列可能已被其他worker取空
+                if pending.empty():
+                    break
+                proxy = pending.get_nowait()
                 try:
-                    is_valid, response_time = task.result()
-                    if is_valid and response_time and response_time <= CONFIG["max_response_time"]:
-                        valid_proxies.append(proxy)
-                except asyncio.CancelledError:
-                    # 任务被取消，忽略
-                    pass
-                except Exception:
-                    # 单个代理验证失败，忽略
-                    pass
-
-                completed_count += 1
-
-                # 根据总数动态调整进度显示频率
-                if total > 10000:
-                    update_interval = 500  # 大量代理时每500个更新一次
-                elif total > 1000:
-                    update_interval = 100   # 中等数量代理每100个更新一次
-                else:
-                    update_interval = 50    # 少量代理每50个更新一次
-
-                if completed_count % update_interval == 0 or completed_count == total:
-                    percent = (completed_count / total) * 100
-                    print(f"进度: {completed_count}/{total} ({percent:.1f}%)，有效: {len(valid_proxies)}")
-
-            # 添加新任务以保持并发数
-            while next_proxy_index < total and len(pending_tasks) < CONFIG["async_validator_concurrency"]:
-                proxy = proxies[next_proxy_index]
-                task = asyncio.create_task(test_proxy_async(proxy, semaphore))
-                pending_tasks[task] = proxy
-                next_proxy_index += 1
-
-    except Exception as e:
-        print(f"[警告] 异步验证异常: {e}")
-        # 取消所有剩余任务
-        for task in pending_tasks:
-            task.cancel()
-        # 等待所有任务被取消
-        await asyncio.gather(*pending_tasks.keys(), return_exceptions=True)
-        raise
-
-    print(f"异步验证完成，有效代理: {len(valid_proxies)}/{total}")
+                    await _validate_one(session, proxy)
+                except Exception as e:
+                    # 单个代理出错（如检查点写入失败）不终止worker，继续处理队列中的其余代理
+                    logger.warning("验证 %s 出错: %s", proxy, e)
+            finally:
+                async with gate:
+                    active -= 1
+                    _adjust_cap()
+                    gate.notify()
+
+    # 所有HTTP代理测试共享同一个连接池；测试URL的DNS解析结果在整个验证过程中缓存
+    connector = aiohttp.TCPConnector(limit=max_concurrency, ttl_dns_cache=300)
+    # 连接阶段单独限时：大部分抓取到的代理已失效，无需等满整个测试超时
+    timeout = aiohttp.ClientTimeout(total=CONFIG["timeout"], sock_connect=CONFIG["connect_timeout"])
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        await asyncio.gather(*(_worker(session) for _ in range(min(max_concurrency, total))))
+
+    logger.info("异步验证完成，有效代理: %s/%s", len(valid_proxies), total)
     return valid_proxies
 
 def validate_proxies(proxies: List[str]) -> List[str]:
@@ -1657,27 +2228,30 @@ def validate_proxies(proxies: List[str]) -> List[str]:
     if CONFIG["validation_method"] == "async":
         # 尝试使用异步验证
         try:
-            return asyncio.run(validate_proxies_async(proxies))
+            return run_async(validate_proxies_async(proxies))
         except ImportError as e:
-            print(f"[警告] 异步验证依赖未安装，回退到同步验证: {e}")
-            print("请运行: pip install -r simple_requirements.txt")
+            logger.warning("[警告] 异步验证依赖未安装，回退到同步验证: %s", e)
+            logger.info("请运行: pip install -r simple_requirements.txt")
             # 回退到同步验证
             CONFIG["validation_method"] = "sync"
         except Exception as e:
-            print(f"[警告] 异步验证失败，回退到同步验证: {e}")
+            logger.warning("[警告] 异步验证失败，回退到同步验证: %s", e)
             CONFIG["validation_method"] = "sync"
 
     if CONFIG["validation_method"] == "sync":
         # 使用同步线程池验证（向后兼容）
-        print(f"开始同步验证 {len(proxies)} 个代理...")
+        logger.info("开始同步验证 %s 个代理...", len(proxies))
 
         valid_proxies = []
         total = len(proxies)
+        update_interval = _progress_interval(total)
+        last_report = time.monotonic()
 
         with ThreadPoolExecutor(max_workers=CONFIG["validator_workers"]) as executor:
             futures = {executor.submit(test_proxy, proxy): proxy for proxy in proxies}
 
             completed = 0
+            checkpointed = 0  # 已写入检查点的有效代理数
             for future in as_completed(futures):
                 completed += 1
                 proxy = futures[future]
@@ -1687,70 +2261,74 @@ def validate_proxies(proxies: List[str]) -> List[str]:
                     if is_valid and response_time and response_time <= CONFIG["max_response_time"]:
                         valid_proxies.append(proxy)
 
-                    # 根据总数动态调整进度显示频率
-                    if total > 10000:
-                        update_interval = 500  # 大量代理时每500个更新一次
-                    elif total > 1000:
-                        update_interval = 100   # 中等数量代理每100个更新一次
-                    else:
-                        update_interval = 50    # 少量代理每50个更新一次
-
                     if completed % update_interval == 0 or completed == total:
+                        append_proxies(valid_proxies[checkpointed:])
+                        checkpointed = len(valid_proxies)
+                    now = time.monotonic()
+                    if completed == total or now - last_report >= PROGRESS_LOG_SECONDS:
+                        last_report = now
                         percent = (completed / total) * 100
-                        print(f"进度: {completed}/{total} ({percent:.1f}%)，有效: {len(valid_proxies)}")
+                        logger.info("进度: %s/%s (%.1f%%)，有效: %s", completed, total, percent, len(valid_proxies))
 
                 except Exception as e:
-                    pass
+                    # 单个代理出错（如检查点写入失败）不中断验证，记录后继续处理其余结果
+                    logger.warning("验证 %s 出错: %s", proxy, e)
 
-        print(f"同步验证完成，有效代理: {len(valid_proxies)}/{total}")
+        logger.info("同步验证完成，有效代理: %s/%s", len(valid_proxies), total)
         return valid_proxies
 
 def merge_proxies(new_proxies: List[str], existing_proxies: List[str]) -> List[str]:
-    """合并新旧代理"""
-    all_proxies = list(set(existing_proxies + new_proxies))
-    return all_proxies
+    """合并新旧代理（直接并入集合，不先拼接出完整的中间列表）"""
+    return list(set(existing_proxies).union(new_proxies))
 
 def main():
     """主函数"""
-    print("=== 极简代理收集器 ===")
+    setup_logging()
+    logger.info("=== 极简代理收集器 ===")
 
     # 设置数据目录
     setup_data_dir()
 
     # 加载已有代理
     existing_proxies = load_existing_proxies()
-    print(f"已有代理: {len(existing_proxies)} 个")
+    logger.info("已有代理: %s 个", len(existing_proxies))
 
     # 爬取新代理
     new_proxies = crawl_proxies()
     if not new_proxies:
-        print("没有获取到新代理")
+        logger.info("没有获取到新代理")
         return
 
-    # 验证新代理
-    valid_new_proxies = validate_proxies(new_proxies+existing_proxies)
-    if not valid_new_proxies:
-        print("没有有效的新代理")
+    # 最近验证通过过的已有代理直接保留，不再重复测试
+    now = time.time()
+    fresh_proxies = {proxy: checked for proxy, checked in existing_proxies.items()
+                     if now - checked < CONFIG["revalidate_after"]}
+    if fresh_proxies:
+        logger.info("跳过 %s 个最近已验证的代理", len(fresh_proxies))
+
+    # 验证新代理（新旧代理去重后每个只测试一次）
+    candidates = set(existing_proxies).union(new_proxies).difference(fresh_proxies)
+    valid_new_proxies = validate_proxies(list(candidates))
+    if not valid_new_proxies and not fresh_proxies:
+        logger.info("没有有效的新代理")
         return
 
     # 合并代理
-    all_proxies = merge_proxies(valid_new_proxies, [])
-    print(f"合并后总代理: {len(all_proxies)} 个")
+    all_proxies = merge_proxies(valid_new_proxies, list(fresh_proxies))
+    logger.info("合并后总代理: %s 个", len(all_proxies))
 
-    # 保存代理
-    if save_proxies(all_proxies):
-        print(f"[成功] 保存成功: {len(all_proxies)} 个代理已保存")
+    # 保存代理（本次验证通过的代理记录为当前时间）
+    if save_proxies(all_proxies, fresh_proxies):
+        logger.info("[成功] 保存成功: %s 个代理已保存", len(all_proxies))
     else:
-        print("[失败] 保存失败")
+        logger.warning("[失败] 保存失败")
 
-    print("=== 运行完成 ===")
+    logger.info("=== 运行完成 ===")
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print("\n[中断] 用户中断")
+        logger.info("\n[中断] 用户中断")
     except Exception as e:
-        print(f"\n[错误] 运行失败: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("\n[错误] 运行失败: %s", e)